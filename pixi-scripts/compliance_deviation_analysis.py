@@ -15,19 +15,355 @@ License: Apache 2.0
 
 import os
 import re
+import sys
+import ast
 import json
+import pickle
+import hashlib
+import heapq
 import argparse
+from bisect import bisect_left
+from collections import defaultdict
 from pathlib import Path
-from typing import Dict, List, Set, Optional, Tuple
-from dataclasses import dataclass, field
+from typing import Callable, Dict, Iterator, List, Set, Optional, Tuple
+from dataclasses import dataclass, field, fields, is_dataclass
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial, wraps
+from operator import itemgetter
 from datetime import datetime
 import subprocess
+import urllib.error
 import urllib.request
+import shutil
 import tempfile
 import zipfile
 
+try:
+    import orjson
+except ImportError:  # optional accelerator, stdlib json is the fallback
+    orjson = None
+
+
+# Slotted dataclasses (Python 3.10+) drop the per-instance __dict__ of the
+# many TestMethod/TestClass records; older interpreters keep plain dataclasses
+_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+# Number of files handed to a parser worker process at a time
+PARSE_CHUNK_SIZE = 32
+
+# Parse results are cached per source file; the script's own mtime is part of
+# the key so edits to the parsers invalidate stale entries
+PARSE_CACHE_DIRNAME = "parse_cache"
+_PARSER_STAMP = os.stat(__file__).st_mtime_ns
+
+# Bytes before a test method searched for its annotations and doc comment
+METHOD_CONTEXT_SIZE = 200
+
+# Download buffering for the upstream archive
+DOWNLOAD_CHUNK_SIZE = 1 << 20
+DOWNLOAD_SPOOL_SIZE = 64 << 20
+
+# Archive members matching the globs used by analyze_upstream_tests
+_UPSTREAM_MEMBER = re.compile(
+    r'(?:/tinkergraph-gremlin/src/test/.*\.java'
+    r'|/gremlin-test/src/main/(?:.*/)?[^/]*Test[^/]*\.java'
+    r'|/gremlin-core/src/test/.*\.java'
+    r'|/[^/]*(?:Structure[^/]*Test|Process[^/]*Test|Compliance)[^/]*\.java)$'
+)
+
+# Precompiled patterns for parsing test sources
+# Sources are scanned as raw bytes; only the small captured groups are decoded.
+# Package, import and class declarations are alternatives of a single pattern
+# so a Java/Kotlin file header is collected in one left-to-right scan.
+_JAVA_HEADER = re.compile(
+    rb'(?P<package>package\s+(?P<package_name>[\w.]+);)'
+    rb'|(?P<import>import\s+(?P<import_name>[\w.]+(?:\.\*)?);)'
+    rb'|(?P<class>public\s+class\s+(?P<class_name>\w+)(?:\s+extends\s+(?P<extends>\w+))?)'
+)
+_JAVA_CLASS_ANNOTATION = re.compile(rb'@(\w+)(?:\([^)]*\))?\s*\n.*?public\s+class')
+_KOTLIN_HEADER = re.compile(
+    rb'(?P<package>package\s+(?P<package_name>[\w.]+))'
+    rb'|(?P<import>import\s+(?P<import_name>[\w.]+))'
+    rb'|(?P<class>class\s+(?P<class_name>\w+)(?:\s*:\s*(?P<extends>\w+))?)'
+)
+_PYTHON_CLASS = re.compile(rb'class\s+(\w+)(?:\([^)]*\))?:')
+_ANNOTATION = re.compile(rb'@(\w+)(?:\([^)]*\))?')
+_DOC_COMMENT = re.compile(rb'/\*\*(.*?)\*/', re.DOTALL)
+_PYTHON_DOCSTRING = re.compile(rb'"""(.*?)"""', re.DOTALL)
+_JAVA_METHOD = re.compile(
+    rb'@Test.*?\n.*?(?:public|private|protected)?\s+(?:static\s+)?void\s+(\w+)\s*\([^)]*\)',
+    re.MULTILINE | re.DOTALL
+)
+_KOTLIN_METHOD = re.compile(
+    rb'@Test.*?\n.*?fun\s+(\w+)\s*\([^)]*\)',
+    re.MULTILINE | re.DOTALL
+)
+_PYTHON_METHOD = re.compile(
+    rb'def\s+(test_\w+)\s*\([^)]*\):',
+    re.MULTILINE
+)
+
+
+# Missing tests are categorized by the package segment following this prefix
+_CATEGORY_ROOT = "org.apache.tinkerpop.gremlin."
+_CATEGORY_DEFS = [
+    ("structure", "Structure API"),
+    ("process", "Process API"),
+    ("tinkergraph", "TinkerGraph Specific"),
+    ("algorithm", "Algorithm"),
+    ("jsr223", "Scripting (JSR223)"),
+    ("util", "Utilities"),
+]
+_CATEGORY_BY_SEGMENT = {segment: name for segment, name in _CATEGORY_DEFS}
+_CATEGORY_META = {
+    "Structure API": {
+        "pattern": r"org\.apache\.tinkerpop\.gremlin\.structure\.",
+        "priority": "CRITICAL",
+        "description": "Core Graph Structure API compliance tests",
+    },
+    "Process API": {
+        "pattern": r"org\.apache\.tinkerpop\.gremlin\.process\.",
+        "priority": "CRITICAL",
+        "description": "Graph traversal and processing API tests",
+    },
+    "TinkerGraph Specific": {
+        "pattern": r"org\.apache\.tinkerpop\.gremlin\.tinkergraph\.",
+        "priority": "HIGH",
+        "description": "TinkerGraph implementation specific tests",
+    },
+    "Algorithm": {
+        "pattern": r"org\.apache\.tinkerpop\.gremlin\.algorithm\.",
+        "priority": "MEDIUM",
+        "description": "Graph algorithm implementation tests",
+    },
+    "Scripting (JSR223)": {
+        "pattern": r"org\.apache\.tinkerpop\.gremlin\.jsr223\.",
+        "priority": "MEDIUM",
+        "description": "Scripting engine and language binding tests",
+    },
+    "Utilities": {
+        "pattern": r"org\.apache\.tinkerpop\.gremlin\.util\.",
+        "priority": "LOW",
+        "description": "Utility classes and helper function tests",
+    },
+}
+# Priorities in report order, with the effort estimate shown for each
+PRIORITY_ORDER = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
+PRIORITY_EFFORT = {
+    "CRITICAL": "🔥 Urgent",
+    "HIGH": "⚡ High",
+    "MEDIUM": "📅 Medium",
+    "LOW": "🕐 Low",
+}
+_OTHER_CATEGORY = {
+    "pattern": ".*",
+    "priority": "LOW",
+    "description": "Uncategorized tests",
+}
+
+# Report status by coverage percentage: (upper bound, (colour, status label,
+# coverage status, conclusion))
+_STATUS_TIERS = (
+    (70, ("#dc3545", "🚨 CRITICAL DEVIATIONS", "🚨 Critical",
+          "🚨 **CRITICAL:** Significant deviations detected requiring immediate attention.")),
+    (90, ("#ffc107", "⚠️ MINOR DEVIATIONS", "⚠️ Needs Improvement",
+          "⚠️ **WARNING:** Some deviations detected requiring review and planning.")),
+)
+_STATUS_ALIGNED = ("#28a745", "✅ GOOD ALIGNMENT", "✅ Good",
+                   "✅ **SUCCESS:** Good alignment with upstream tests, minor improvements possible.")
+
+
+def _status(cov: float) -> Tuple[str, str, str, str]:
+    """Return the colour, status label, coverage status and conclusion for a coverage level."""
+    for bound, status in _STATUS_TIERS:
+        if cov < bound:
+            return status
+    return _STATUS_ALIGNED
+
+
+# Static HTML report head; the status colour is written between the parts
+_HTML_HEAD_PRE_COLOR = """<!DOCTYPE html>
+<html lang="en">
+<head>
+    <meta charset="UTF-8">
+    <meta name="viewport" content="width=device-width, initial-scale=1.0">
+    <title>TinkerPop Compliance Deviation Analysis</title>
+    <style>
+        body { font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 0; padding: 20px; background: #f8f9fa; }
+        .container { max-width: 1200px; margin: 0 auto; }
+        .header { background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 20px; }
+        .status-badge { display: inline-block; padding: 8px 16px; border-radius: 20px; color: white; font-weight: bold; background: """
+_HTML_HEAD_MID_COLOR = """; }
+        .metrics-grid { display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 20px 0; }
+        .metric-card { background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .metric-value { font-size: 2em; font-weight: bold; color: #333; }
+        .metric-label { color: #666; margin-bottom: 10px; }
+        .section { background: white; margin: 20px 0; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }
+        .test-list { max-height: 300px; overflow-y: auto; background: #f8f9fa; padding: 10px; border-radius: 4px; }
+        .test-item { padding: 5px 0; font-family: monospace; border-bottom: 1px solid #eee; }
+        .recommendations { background: #e7f3ff; border-left: 4px solid #2196f3; }
+        .critical { background: #ffe7e7; border-left: 4px solid #dc3545; }
+        .warning { background: #fff3cd; border-left: 4px solid #ffc107; }
+        .success { background: #d4edda; border-left: 4px solid #28a745; }
+        table { width: 100%; border-collapse: collapse; }
+        th, td { padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }
+        th { background: #f8f9fa; font-weight: 600; }
+        .progress-bar { background: #e9ecef; height: 20px; border-radius: 10px; overflow: hidden; }
+        .progress-fill { height: 100%; background: """
+_HTML_HEAD_POST_COLOR = """; transition: width 0.3s ease; }
+    </style>
+</head>
+<body>
+"""
+
+def _new_categories() -> Dict[str, Dict]:
+    """Return empty category buckets for missing tests."""
+    return {
+        name: {**meta, "tests": [], "missing_count": 0}
+        for name, meta in _CATEGORY_META.items()
+    }
+
+
+def _categorize(categories: Dict[str, Dict], test_method: str) -> None:
+    """Add a test to its category bucket, keyed on the package segment after the gremlin prefix."""
+    category_name = None
+    if test_method.startswith(_CATEGORY_ROOT):
+        segment, dot, _ = test_method[len(_CATEGORY_ROOT):].partition('.')
+        if dot:
+            category_name = _CATEGORY_BY_SEGMENT.get(segment)
+
+    if category_name is None:
+        # Handle uncategorized tests
+        if "Other" not in categories:
+            categories["Other"] = {**_OTHER_CATEGORY, "tests": [], "missing_count": 0}
+        category_name = "Other"
+
+    category_info = categories[category_name]
+    category_info["tests"].append(test_method)
+    category_info["missing_count"] += 1
+
+
+def _scan_header(content: bytes, pattern: re.Pattern) -> Tuple[str, List[str], Optional[re.Match]]:
+    """Scan source once for its package, all imports and the first class declaration."""
+    package = None
+    imports = []
+    class_match = None
+    for match in pattern.finditer(content):
+        kind = match.lastgroup
+        if kind == 'import':
+            imports.append(match.group('import_name').decode('ascii'))
+        elif kind == 'package':
+            if package is None:
+                package = match.group('package_name').decode('ascii')
+        elif class_match is None:
+            class_match = match
+    return package or "", imports, class_match
+
+
+def _newline_offsets(content: bytes) -> List[int]:
+    """Return the offsets of every newline so line numbers can be found by bisection."""
+    offsets = []
+    append = offsets.append
+    pos = content.find(b'\n')
+    while pos != -1:
+        append(pos)
+        pos = content.find(b'\n', pos + 1)
+    return offsets
+
+
+def _walk_files(root: Path) -> Iterator[os.DirEntry]:
+    """Recursively yield the file entries below root with a single scandir per directory."""
+    with os.scandir(root) as entries:
+        for entry in entries:
+            if entry.is_dir(follow_symlinks=False):
+                yield from _walk_files(entry.path)
+            elif entry.is_file():
+                yield entry
+
+
+def _parse_safely(parser: Callable[[Path], 'TestClass'],
+                  file_path: Path) -> Tuple[Optional['TestClass'], Optional[Exception]]:
+    """Run a parser in a worker process, returning the error instead of raising it."""
+    try:
+        return parser(file_path), None
+    except Exception as e:
+        return None, e
+
+
+def _write_report(output_path: Path, text: str) -> None:
+    """Encode a report once and hand it to the OS in as few write calls as possible."""
+    _write_bytes(output_path, text.encode('utf-8'))
+
+
+def _write_bytes(output_path: Path, payload: bytes) -> None:
+    """Write an encoded report with raw os.write calls."""
+    data = memoryview(payload)
+    fd = os.open(output_path, os.O_WRONLY | os.O_CREAT | os.O_TRUNC, 0o644)
+    try:
+        while data:
+            data = data[os.write(fd, data):]
+    finally:
+        os.close(fd)
+
+
+def _inputs_digest(upstream_tests: Dict[str, 'TestClass'], local_tests: Dict[str, 'TestClass']) -> str:
+    """Hash the parsed tests a report is built from, plus this script's own version."""
+    key = hashlib.blake2b(str(_PARSER_STAMP).encode(), digest_size=16)
+    for tests in (upstream_tests, local_tests):
+        for class_key in sorted(tests):
+            key.update(repr((class_key, tests[class_key])).encode('utf-8'))
+        key.update(b'\0')
+    return key.hexdigest()
+
+
+def _json_default(obj):
+    """Serialize report dataclasses by their fields for json.dump."""
+    if is_dataclass(obj):
+        return {f.name: getattr(obj, f.name) for f in fields(obj)}
+    raise TypeError(f"Object of type {type(obj).__name__} is not JSON serializable")
+
+
+def _cached(parser: Callable[..., 'TestClass']) -> Callable[..., 'TestClass']:
+    """
+    Cache a parser's TestClass on disk, one entry per parser and file path.
+
+    Each entry records the parser stamp and the file mtime and size it was
+    built from. A stale entry is overwritten in place, so re-extracting the
+    upstream archive replaces entries instead of adding a new set.
+    """
+    @wraps(parser)
+    def wrapper(self, file_path: Path) -> 'TestClass':
+        st = os.stat(file_path)
+        stamp = (_PARSER_STAMP, st.st_mtime_ns, st.st_size)
+        key = hashlib.blake2b(
+            f"{parser.__name__}|{file_path}".encode(), digest_size=16
+        ).hexdigest()
+        cache_file = self.parse_cache_dir / f"{key}.pkl"
+        try:
+            cached_stamp, test_class = pickle.loads(cache_file.read_bytes())
+            if cached_stamp == stamp:
+                return test_class
+        except (OSError, pickle.UnpicklingError, EOFError, ImportError, AttributeError,
+                TypeError, ValueError):
+            # Missing, truncated, from an older cache layout, or pickled by a
+            # differently-named module
+            pass
+
+        test_class = parser(self, file_path)
+        try:
+            self.parse_cache_dir.mkdir(parents=True, exist_ok=True)
+            # Write then rename so concurrent workers never see a partial entry
+            tmp_file = cache_file.with_suffix(f".{os.getpid()}.tmp")
+            tmp_file.write_bytes(pickle.dumps((stamp, test_class),
+                                              protocol=pickle.HIGHEST_PROTOCOL))
+            os.replace(tmp_file, cache_file)
+        except OSError:
+            pass
+        return test_class
+    return wrapper
 
-@dataclass
+
+@dataclass(**_SLOTS)
 class TestMethod:
     """Represents a test method with its metadata."""
     name: str
@@ -40,7 +376,7 @@ class TestMethod:
     category: Optional[str] = None
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class TestClass:
     """Represents a test class with its methods."""
     name: str
@@ -52,7 +388,7 @@ class TestClass:
     imports: List[str] = field(default_factory=list)
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class DeviationReport:
     """Contains the complete deviation analysis."""
     timestamp: str
@@ -63,7 +399,93 @@ class DeviationReport:
     modified_tests: List[Tuple[str, str, str]]  # test_name, upstream_sig, local_sig
     coverage_analysis: Dict[str, float]
     recommendations: List[str]
-    test_categories: Dict[str, Dict] = None
+    test_categories: Dict[str, Dict] = field(default_factory=dict)
+
+
+@dataclass(frozen=True)
+class LangSpec:
+    """Patterns and rules that distinguish one JVM test source language."""
+    header: re.Pattern
+    method: re.Pattern
+    marker: bytes = b'@Test'
+    class_annotations: Optional[re.Pattern] = None
+    requires_class: bool = False
+
+
+# Every Python test function name contains this
+PYTHON_TEST_MARKER = b'test_'
+
+JAVA_SPEC = LangSpec(
+    header=_JAVA_HEADER,
+    method=_JAVA_METHOD,
+    class_annotations=_JAVA_CLASS_ANNOTATION,
+    requires_class=True
+)
+KOTLIN_SPEC = LangSpec(header=_KOTLIN_HEADER, method=_KOTLIN_METHOD)
+
+
+def _parse_generic(file_path: Path, spec: LangSpec) -> TestClass:
+    """Parse a Java or Kotlin test file according to its language spec."""
+    content = file_path.read_bytes()
+
+    # Helpers without any test methods skip the regex scans entirely
+    if spec.marker not in content:
+        return TestClass(file_path.stem, str(file_path), "")
+
+    # Extract package, imports and class declaration
+    package, imports, class_match = _scan_header(content, spec.header)
+    if class_match:
+        class_name = class_match.group('class_name').decode('ascii')
+        extends = class_match.group('extends')
+        if extends is not None:
+            extends = extends.decode('ascii')
+    elif spec.requires_class:
+        return TestClass(file_path.stem, str(file_path), package)
+    else:
+        class_name = file_path.stem
+        extends = None
+
+    # Extract class annotations
+    class_annotations = []
+    if spec.class_annotations is not None:
+        class_annotations = [a.decode('ascii') for a in spec.class_annotations.findall(content)]
+
+    test_class = TestClass(
+        name=class_name,
+        file_path=str(file_path),
+        package=package,
+        extends=extends,
+        imports=imports,
+        annotations=class_annotations
+    )
+
+    # Extract test methods
+    newlines = _newline_offsets(content)
+    for match in spec.method.finditer(content):
+        method_name = match.group(1).decode('ascii')
+        line_number = bisect_left(newlines, match.start()) + 1
+
+        # Extract method annotations from the window leading up to the method,
+        # bounding the scans with pos/endpos rather than slicing a copy
+        window_start = max(0, match.start() - METHOD_CONTEXT_SIZE)
+        window_end = match.end()
+        annotations = [a.decode('ascii') for a in _ANNOTATION.findall(content, window_start, window_end)]
+
+        # Extract method description from comments
+        desc_match = _DOC_COMMENT.search(content, window_start, window_end)
+        description = desc_match.group(1).decode('utf-8', 'ignore').strip() if desc_match else None
+
+        test_method = TestMethod(
+            name=method_name,
+            class_name=class_name,
+            file_path=str(file_path),
+            line_number=line_number,
+            annotations=annotations,
+            description=description
+        )
+        test_class.methods.append(test_method)
+
+    return test_class
 
 
 class ComplianceTestAnalyzer:
@@ -73,20 +495,8 @@ class ComplianceTestAnalyzer:
         self.project_root = project_root
         self.upstream_cache_dir = project_root / "build" / "upstream_tests"
         self.reports_dir = project_root / "build" / "reports" / "compliance"
-
-        # Patterns for parsing different test file types
-        self.java_method_pattern = re.compile(
-            r'@Test.*?\n.*?(?:public|private|protected)?\s+(?:static\s+)?void\s+(\w+)\s*\([^)]*\)',
-            re.MULTILINE | re.DOTALL
-        )
-        self.kotlin_method_pattern = re.compile(
-            r'@Test.*?\n.*?fun\s+(\w+)\s*\([^)]*\)',
-            re.MULTILINE | re.DOTALL
-        )
-        self.python_method_pattern = re.compile(
-            r'def\s+(test_\w+)\s*\([^)]*\):',
-            re.MULTILINE
-        )
+        self.parse_cache_dir = self.reports_dir / PARSE_CACHE_DIRNAME
+        self.last_hash_path = self.reports_dir / ".last_hash"
 
     def download_upstream_tests(self) -> bool:
         """Download upstream Apache TinkerPop test sources."""
@@ -98,20 +508,41 @@ class ComplianceTestAnalyzer:
         try:
             self.upstream_cache_dir.mkdir(parents=True, exist_ok=True)
 
-            # Download the archive
-            zip_path = self.upstream_cache_dir / "tinkerpop-master.zip"
-            print(f"   Downloading from {upstream_url}...")
-            urllib.request.urlretrieve(upstream_url, zip_path)
-
-            # Extract test files
+            # Send the ETag from the last download so an unchanged
+            # archive is answered with 304 Not Modified instead of a body
             extract_dir = self.upstream_cache_dir / "extracted"
-            with zipfile.ZipFile(zip_path, 'r') as zip_ref:
-                # Only extract test-related files
-                for member in zip_ref.namelist():
-                    if any(test_path in member for test_path in [
-                        '/test/', '/tests/', 'Test.java', 'Test.kt', 'test_', 'compliance'
-                    ]):
-                        zip_ref.extract(member, extract_dir)
+            etag_path = self.upstream_cache_dir / "master.etag"
+            request = urllib.request.Request(upstream_url)
+            if etag_path.exists() and extract_dir.exists():
+                request.add_header('If-None-Match', etag_path.read_text(encoding='utf-8').strip())
+
+            # Stream the archive into a spooled buffer that only spills to disk when large
+            print(f"   Downloading from {upstream_url}...")
+            try:
+                response = urllib.request.urlopen(request)
+            except urllib.error.HTTPError as e:
+                if e.code != 304:
+                    raise
+                print("✅ Upstream tests are up to date")
+                return True
+
+            with response, \
+                    tempfile.SpooledTemporaryFile(max_size=DOWNLOAD_SPOOL_SIZE) as archive:
+                shutil.copyfileobj(response, archive, DOWNLOAD_CHUNK_SIZE)
+                archive.seek(0)
+                etag = response.headers.get('ETag')
+
+                # Only extract the files analyze_upstream_tests will parse
+                with zipfile.ZipFile(archive, 'r') as zip_ref:
+                    for member in zip_ref.namelist():
+                        if _UPSTREAM_MEMBER.search(member):
+                            zip_ref.extract(member, extract_dir)
+
+            # Record the ETag only once extraction has completed
+            if etag:
+                etag_path.write_text(etag, encoding='utf-8')
+            elif etag_path.exists():
+                etag_path.unlink()
 
             print("✅ Upstream tests downloaded successfully")
             return True
@@ -120,126 +551,62 @@ class ComplianceTestAnalyzer:
             print(f"❌ Failed to download upstream tests: {e}")
             return False
 
+    @_cached
     def parse_java_tests(self, file_path: Path) -> TestClass:
         """Parse Java test files and extract test information."""
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-
-        # Extract package
-        package_match = re.search(r'package\s+([\w.]+);', content)
-        package = package_match.group(1) if package_match else ""
-
-        # Extract class name and metadata
-        class_match = re.search(r'public\s+class\s+(\w+)(?:\s+extends\s+(\w+))?', content)
-        if not class_match:
-            return TestClass(file_path.stem, str(file_path), package)
-
-        class_name = class_match.group(1)
-        extends = class_match.group(2)
-
-        # Extract imports
-        imports = re.findall(r'import\s+([\w.]+(?:\.\*)?);', content)
-
-        # Extract class annotations
-        class_annotations = re.findall(r'@(\w+)(?:\([^)]*\))?\s*\n.*?public\s+class', content)
-
-        test_class = TestClass(
-            name=class_name,
-            file_path=str(file_path),
-            package=package,
-            extends=extends,
-            imports=imports,
-            annotations=class_annotations
-        )
-
-        # Extract test methods
-        for match in self.java_method_pattern.finditer(content):
-            method_name = match.group(1)
-            line_number = content[:match.start()].count('\n') + 1
-
-            # Extract method annotations
-            method_start = match.start()
-            method_text = content[max(0, method_start-200):match.end()]
-            annotations = re.findall(r'@(\w+)(?:\([^)]*\))?', method_text)
-
-            # Extract method description from comments
-            desc_match = re.search(r'/\*\*(.*?)\*/', method_text, re.DOTALL)
-            description = desc_match.group(1).strip() if desc_match else None
-
-            test_method = TestMethod(
-                name=method_name,
-                class_name=class_name,
-                file_path=str(file_path),
-                line_number=line_number,
-                annotations=annotations,
-                description=description
-            )
-            test_class.methods.append(test_method)
-
-        return test_class
+        return _parse_generic(file_path, JAVA_SPEC)
 
+    @_cached
     def parse_kotlin_tests(self, file_path: Path) -> TestClass:
         """Parse Kotlin test files and extract test information."""
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
-
-        # Extract package
-        package_match = re.search(r'package\s+([\w.]+)', content)
-        package = package_match.group(1) if package_match else ""
-
-        # Extract class name
-        class_match = re.search(r'class\s+(\w+)(?:\s*:\s*(\w+))?', content)
-        class_name = class_match.group(1) if class_match else file_path.stem
-        extends = class_match.group(2) if class_match and class_match.group(2) else None
-
-        # Extract imports
-        imports = re.findall(r'import\s+([\w.]+)', content)
-
-        test_class = TestClass(
-            name=class_name,
-            file_path=str(file_path),
-            package=package,
-            extends=extends,
-            imports=imports
-        )
-
-        # Extract test methods
-        for match in self.kotlin_method_pattern.finditer(content):
-            method_name = match.group(1)
-            line_number = content[:match.start()].count('\n') + 1
-
-            # Extract method annotations
-            method_start = match.start()
-            method_text = content[max(0, method_start-200):match.end()]
-            annotations = re.findall(r'@(\w+)(?:\([^)]*\))?', method_text)
-
-            # Extract method description from comments
-            desc_match = re.search(r'/\*\*(.*?)\*/', method_text, re.DOTALL)
-            description = desc_match.group(1).strip() if desc_match else None
-
-            test_method = TestMethod(
-                name=method_name,
-                class_name=class_name,
-                file_path=str(file_path),
-                line_number=line_number,
-                annotations=annotations,
-                description=description
-            )
-            test_class.methods.append(test_method)
-
-        return test_class
+        return _parse_generic(file_path, KOTLIN_SPEC)
 
+    @_cached
     def parse_python_tests(self, file_path: Path) -> TestClass:
         """Parse Python test files and extract test information."""
-        content = file_path.read_text(encoding='utf-8', errors='ignore')
+        content = file_path.read_bytes()
+
+        # Files without any test functions skip parsing entirely
+        if PYTHON_TEST_MARKER not in content:
+            return TestClass(file_path.stem, str(file_path), "")
 
         # Extract class name
-        class_match = re.search(r'class\s+(\w+)(?:\([^)]*\))?:', content)
-        class_name = class_match.group(1) if class_match else file_path.stem
+        class_match = _PYTHON_CLASS.search(content)
+        class_name = class_match.group(1).decode('ascii') if class_match else file_path.stem
+
+        # Extract imports and test functions from the syntax tree
+        try:
+            tree = ast.parse(content, filename=str(file_path))
+        except (SyntaxError, ValueError):
+            tree = None
 
-        # Extract imports
-        imports = re.findall(r'(?:from\s+[\w.]+\s+)?import\s+([\w.,\s*]+)', content)
         flat_imports = []
-        for imp in imports:
-            flat_imports.extend([i.strip() for i in imp.split(',')])
+        methods = []
+        if tree is not None:
+            for node in ast.walk(tree):
+                if isinstance(node, ast.Import):
+                    flat_imports.extend(alias.name for alias in node.names)
+                elif isinstance(node, ast.ImportFrom):
+                    module = "." * node.level + (node.module or "")
+                    flat_imports.extend(f"{module}.{alias.name}" for alias in node.names)
+                elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)) \
+                        and node.name.startswith('test_'):
+                    docstring = ast.get_docstring(node, clean=False)
+                    methods.append((node.lineno, node.name, docstring.strip() if docstring else None))
+            methods.sort()
+        else:
+            # Fall back to a textual scan for sources that do not parse
+            newlines = _newline_offsets(content)
+            for match in _PYTHON_METHOD.finditer(content):
+                method_end = content.find(b'\n    def ', match.end())
+                if method_end == -1:
+                    method_end = len(content)
+                desc_match = _PYTHON_DOCSTRING.search(content, match.start(), method_end)
+                methods.append((
+                    bisect_left(newlines, match.start()) + 1,
+                    match.group(1).decode('ascii'),
+                    desc_match.group(1).decode('utf-8', 'ignore').strip() if desc_match else None
+                ))
 
         test_class = TestClass(
             name=class_name,
@@ -248,20 +615,7 @@ class ComplianceTestAnalyzer:
             imports=flat_imports
         )
 
-        # Extract test methods
-        for match in self.python_method_pattern.finditer(content):
-            method_name = match.group(1)
-            line_number = content[:match.start()].count('\n') + 1
-
-            # Extract method docstring as description
-            method_end = content.find('\n    def ', match.end())
-            if method_end == -1:
-                method_end = len(content)
-            method_text = content[match.start():method_end]
-
-            desc_match = re.search(r'"""(.*?)"""', method_text, re.DOTALL)
-            description = desc_match.group(1).strip() if desc_match else None
-
+        for line_number, method_name, description in methods:
             test_method = TestMethod(
                 name=method_name,
                 class_name=class_name,
@@ -273,6 +627,19 @@ class ComplianceTestAnalyzer:
 
         return test_class
 
+    def _parse_files(self, parser: Callable[[Path], TestClass],
+                     files: List[Path]) -> Iterator[Tuple[Path, Optional[TestClass], Optional[Exception]]]:
+        """Parse test files across worker processes, yielding results in input order."""
+        if len(files) < PARSE_CHUNK_SIZE:
+            for test_file in files:
+                yield (test_file, *_parse_safely(parser, test_file))
+            return
+
+        with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+            results = executor.map(partial(_parse_safely, parser), files, chunksize=PARSE_CHUNK_SIZE)
+            for test_file, (test_class, error) in zip(files, results):
+                yield test_file, test_class, error
+
     def analyze_upstream_tests(self) -> Dict[str, TestClass]:
         """Analyze upstream Apache TinkerPop tests."""
         print("🔍 Analyzing upstream Apache TinkerPop tests...")
@@ -294,17 +661,21 @@ class ComplianceTestAnalyzer:
             "**/*Compliance*.java"
         ]
 
-        for pattern in test_patterns:
-            for test_file in extract_dir.rglob(pattern):
-                if test_file.is_file():
-                    try:
-                        test_class = self.parse_java_tests(test_file)
-                        if test_class.methods:  # Only include classes with test methods
-                            key = f"{test_class.package}.{test_class.name}"
-                            upstream_tests[key] = test_class
-                            print(f"   Found upstream test class: {key} ({len(test_class.methods)} methods)")
-                    except Exception as e:
-                        print(f"   ⚠️  Error parsing {test_file}: {e}")
+        # A file may match several patterns; parse each one only once
+        test_files = list(dict.fromkeys(
+            test_file
+            for pattern in test_patterns
+            for test_file in extract_dir.rglob(pattern)
+            if test_file.is_file()
+        ))
+
+        for test_file, test_class, error in self._parse_files(self.parse_java_tests, test_files):
+            if error is not None:
+                print(f"   ⚠️  Error parsing {test_file}: {error}")
+            elif test_class.methods:  # Only include classes with test methods
+                key = f"{test_class.package}.{test_class.name}"
+                upstream_tests[key] = test_class
+                print(f"   Found upstream test class: {key} ({len(test_class.methods)} methods)")
 
         print(f"✅ Analyzed {len(upstream_tests)} upstream test classes")
         return upstream_tests
@@ -315,136 +686,63 @@ class ComplianceTestAnalyzer:
 
         local_tests = {}
 
-        # Analyze Java tests
-        java_test_dirs = [
+        test_roots = [
+            # Java tests
             self.project_root / "src" / "jvmTest" / "java",
             self.project_root / "src" / "jvmCompliance" / "java",
-            self.project_root / "src" / "test" / "java"
-        ]
-
-        for test_dir in java_test_dirs:
-            if test_dir.exists():
-                for test_file in test_dir.rglob("*.java"):
-                    # Skip deprecated files
-                    if "_DEPRECATED" in test_file.name:
-                        continue
-                    if "compliance" in test_file.name.lower() or "test" in test_file.name.lower():
-                        try:
-                            test_class = self.parse_java_tests(test_file)
-                            if test_class.methods:
-                                key = f"{test_class.package}.{test_class.name}"
-                                local_tests[key] = test_class
-                                print(f"   Found local Java test: {key} ({len(test_class.methods)} methods)")
-                        except Exception as e:
-                            print(f"   ⚠️  Error parsing {test_file}: {e}")
-
-        # Analyze Kotlin tests
-        kotlin_test_dirs = [
+            self.project_root / "src" / "test" / "java",
+            # Kotlin tests
             self.project_root / "src" / "jvmTest" / "kotlin",
             self.project_root / "src" / "jsTest" / "kotlin",
             self.project_root / "src" / "nativeTest" / "kotlin",
-            self.project_root / "src" / "commonTest" / "kotlin"
+            self.project_root / "src" / "commonTest" / "kotlin",
+            # Python tests
+            self.project_root / "python" / "tests",
         ]
 
-        for test_dir in kotlin_test_dirs:
-            if test_dir.exists():
-                for test_file in test_dir.rglob("*.kt"):
-                    if "compliance" in test_file.name.lower() or "test" in test_file.name.lower():
-                        try:
-                            test_class = self.parse_kotlin_tests(test_file)
-                            if test_class.methods:
-                                key = f"{test_class.package}.{test_class.name}"
-                                local_tests[key] = test_class
-                                print(f"   Found local Kotlin test: {key} ({len(test_class.methods)} methods)")
-                        except Exception as e:
-                            print(f"   ⚠️  Error parsing {test_file}: {e}")
-
-        # Analyze Python tests
-        python_test_dir = self.project_root / "python" / "tests"
-        if python_test_dir.exists():
-            for test_file in python_test_dir.rglob("*.py"):
-                if "compliance" in test_file.name.lower() or test_file.name.startswith("test_"):
-                    try:
-                        test_class = self.parse_python_tests(test_file)
-                        if test_class.methods:
-                            key = f"python.{test_class.name}"
-                            local_tests[key] = test_class
-                            print(f"   Found local Python test: {key} ({len(test_class.methods)} methods)")
-                    except Exception as e:
-                        print(f"   ⚠️  Error parsing {test_file}: {e}")
+        # Walk each root once, sorting candidate files by language
+        java_files = []
+        kotlin_files = []
+        python_files = []
+        for test_root in test_roots:
+            if not test_root.exists():
+                continue
+            for entry in _walk_files(test_root):
+                name = entry.name
+                lower_name = name.lower()
+                if "compliance" not in lower_name and "test" not in lower_name:
+                    continue
+                if name.endswith(".java"):
+                    # Skip deprecated files
+                    if "_DEPRECATED" not in name:
+                        java_files.append(Path(entry.path))
+                elif name.endswith(".kt"):
+                    kotlin_files.append(Path(entry.path))
+                elif name.endswith(".py") and ("compliance" in lower_name or name.startswith("test_")):
+                    python_files.append(Path(entry.path))
+
+        for language, parser, files in (
+            ("Java", self.parse_java_tests, java_files),
+            ("Kotlin", self.parse_kotlin_tests, kotlin_files),
+            ("Python", self.parse_python_tests, python_files),
+        ):
+            for test_file, test_class, error in self._parse_files(parser, files):
+                if error is not None:
+                    print(f"   ⚠️  Error parsing {test_file}: {error}")
+                elif test_class.methods:
+                    package = "python" if language == "Python" else test_class.package
+                    key = f"{package}.{test_class.name}"
+                    local_tests[key] = test_class
+                    print(f"   Found local {language} test: {key} ({len(test_class.methods)} methods)")
 
         print(f"✅ Analyzed {len(local_tests)} local test classes")
         return local_tests
 
     def categorize_tests(self, test_methods: List[str]) -> Dict[str, Dict]:
         """Categorize tests by TinkerPop API area and priority."""
-        categories = {
-            "Structure API": {
-                "pattern": r"org\.apache\.tinkerpop\.gremlin\.structure\.",
-                "priority": "CRITICAL",
-                "description": "Core Graph Structure API compliance tests",
-                "tests": [],
-                "missing_count": 0
-            },
-            "Process API": {
-                "pattern": r"org\.apache\.tinkerpop\.gremlin\.process\.",
-                "priority": "CRITICAL",
-                "description": "Graph traversal and processing API tests",
-                "tests": [],
-                "missing_count": 0
-            },
-            "TinkerGraph Specific": {
-                "pattern": r"org\.apache\.tinkerpop\.gremlin\.tinkergraph\.",
-                "priority": "HIGH",
-                "description": "TinkerGraph implementation specific tests",
-                "tests": [],
-                "missing_count": 0
-            },
-            "Algorithm": {
-                "pattern": r"org\.apache\.tinkerpop\.gremlin\.algorithm\.",
-                "priority": "MEDIUM",
-                "description": "Graph algorithm implementation tests",
-                "tests": [],
-                "missing_count": 0
-            },
-            "Scripting (JSR223)": {
-                "pattern": r"org\.apache\.tinkerpop\.gremlin\.jsr223\.",
-                "priority": "MEDIUM",
-                "description": "Scripting engine and language binding tests",
-                "tests": [],
-                "missing_count": 0
-            },
-            "Utilities": {
-                "pattern": r"org\.apache\.tinkerpop\.gremlin\.util\.",
-                "priority": "LOW",
-                "description": "Utility classes and helper function tests",
-                "tests": [],
-                "missing_count": 0
-            }
-        }
-
-        # Categorize each test method
+        categories = _new_categories()
         for test_method in test_methods:
-            categorized = False
-            for category_name, category_info in categories.items():
-                if re.match(category_info["pattern"], test_method):
-                    category_info["tests"].append(test_method)
-                    category_info["missing_count"] += 1
-                    categorized = True
-                    break
-
-            if not categorized:
-                # Handle uncategorized tests
-                if "Other" not in categories:
-                    categories["Other"] = {
-                        "pattern": ".*",
-                        "priority": "LOW",
-                        "description": "Uncategorized tests",
-                        "tests": [],
-                        "missing_count": 0
-                    }
-                categories["Other"]["tests"].append(test_method)
-                categories["Other"]["missing_count"] += 1
+            _categorize(categories, test_method)
 
         return categories
 
@@ -454,25 +752,28 @@ class ComplianceTestAnalyzer:
         print("📊 Comparing upstream vs local tests...")
 
         # Collect all test methods for comparison
-        upstream_methods = {}
-        local_methods = {}
-
-        for class_key, test_class in upstream_tests.items():
-            for method in test_class.methods:
-                method_key = f"{class_key}.{method.name}"
-                upstream_methods[method_key] = method
-
-        for class_key, test_class in local_tests.items():
-            for method in test_class.methods:
-                method_key = f"{class_key}.{method.name}"
-                local_methods[method_key] = method
+        upstream_methods = {
+            f"{class_key}.{method.name}": method
+            for class_key, test_class in upstream_tests.items()
+            for method in test_class.methods
+        }
+        local_methods = {
+            f"{class_key}.{method.name}": method
+            for class_key, test_class in local_tests.items()
+            for method in test_class.methods
+        }
 
         # Identify deviations
-        upstream_method_names = set(upstream_methods.keys())
-        local_method_names = set(local_methods.keys())
+        upstream_method_names = upstream_methods.keys()
+        local_method_names = local_methods.keys()
 
-        missing_tests = list(upstream_method_names - local_method_names)
-        extra_tests = list(local_method_names - upstream_method_names)
+        # Missing tests are categorized as they are collected
+        missing_tests = []
+        test_categories = _new_categories()
+        for test_name in sorted(upstream_method_names - local_method_names):
+            missing_tests.append(test_name)
+            _categorize(test_categories, test_name)
+        extra_tests = sorted(local_method_names - upstream_method_names)
 
         # Find similar but modified tests
         modified_tests = []
@@ -482,11 +783,12 @@ class ComplianceTestAnalyzer:
             upstream_method = upstream_methods[test_name]
             local_method = local_methods[test_name]
 
-            # Compare method signatures and descriptions
-            upstream_sig = f"{upstream_method.name}({','.join(upstream_method.parameters)})"
-            local_sig = f"{local_method.name}({','.join(local_method.parameters)})"
-
-            if upstream_sig != local_sig or upstream_method.description != local_method.description:
+            # Compare parameters and descriptions; signatures are only
+            # formatted for tests that actually differ
+            if (upstream_method.parameters, upstream_method.description) != \
+                    (local_method.parameters, local_method.description):
+                upstream_sig = f"{upstream_method.name}({','.join(upstream_method.parameters)})"
+                local_sig = f"{local_method.name}({','.join(local_method.parameters)})"
                 modified_tests.append((test_name, upstream_sig, local_sig))
 
         # Calculate coverage analysis
@@ -499,9 +801,6 @@ class ComplianceTestAnalyzer:
             "extra_percentage": (len(extra_tests) / len(upstream_methods) * 100) if upstream_methods else 0
         }
 
-        # Categorize missing tests
-        test_categories = self.categorize_tests(missing_tests)
-
         # Generate recommendations
         recommendations = self.generate_recommendations(
             missing_tests, extra_tests, modified_tests, coverage_analysis, test_categories
@@ -608,18 +907,18 @@ class ComplianceTestAnalyzer:
             )
 
         # Specific recommendations based on patterns
-        structure_missing = [t for t in missing_tests if "structure" in t.lower()]
-        process_missing = [t for t in missing_tests if "process" in t.lower()]
+        structure_missing = sum(1 for t in missing_tests if "structure" in t.lower())
+        process_missing = sum(1 for t in missing_tests if "process" in t.lower())
 
         if structure_missing:
             recommendations.append(
-                f"🏗️  STRUCTURE API: {len(structure_missing)} missing Structure API tests. "
+                f"🏗️  STRUCTURE API: {structure_missing} missing Structure API tests. "
                 "These are critical for graph database compliance."
             )
 
         if process_missing:
             recommendations.append(
-                f"⚙️  PROCESS API: {len(process_missing)} missing Process API tests. "
+                f"⚙️  PROCESS API: {process_missing} missing Process API tests. "
                 "These are important for traversal compliance."
             )
 
@@ -634,7 +933,15 @@ class ComplianceTestAnalyzer:
 
     def generate_asciidoc_report(self, report: DeviationReport, output_path: Path):
         """Generate AsciiDoc format deviation report."""
-        content = f"""= TinkerPop Compliance Test Deviation Analysis Report
+        cov = report.coverage_analysis['coverage_percentage']
+        n_missing = len(report.missing_tests)
+        n_extra = len(report.extra_tests)
+        n_modified = len(report.modified_tests)
+        _, status_label, coverage_status, conclusion = _status(cov)
+        parts = []
+        write = parts.append
+        extend = parts.extend
+        write(f"""= TinkerPop Compliance Test Deviation Analysis Report
 :toc:
 :toclevels: 3
 :sectanchors:
@@ -643,8 +950,8 @@ class ComplianceTestAnalyzer:
 == Executive Summary
 
 **Analysis Date:** {report.timestamp} +
-**Report Status:** {'🚨 CRITICAL DEVIATIONS' if report.coverage_analysis['coverage_percentage'] < 70 else '⚠️ MINOR DEVIATIONS' if report.coverage_analysis['coverage_percentage'] < 90 else '✅ GOOD ALIGNMENT'} +
-**Coverage Level:** {report.coverage_analysis['coverage_percentage']:.1f}%
+**Report Status:** {status_label} +
+**Coverage Level:** {cov:.1f}%
 
 This report analyzes the deviation between upstream Apache TinkerPop compliance tests and local TinkerGraphs compliance test implementations.
 
@@ -667,193 +974,204 @@ This report analyzes the deviation between upstream Apache TinkerPop compliance
 | Implementation
 
 | Coverage Percentage
-| {report.coverage_analysis['coverage_percentage']:.1f}%
-| {'✅ Good' if report.coverage_analysis['coverage_percentage'] >= 90 else '⚠️ Needs Improvement' if report.coverage_analysis['coverage_percentage'] >= 70 else '🚨 Critical'}
+| {cov:.1f}%
+| {coverage_status}
 
 | Missing Tests
-| {len(report.missing_tests)}
+| {n_missing}
 | {'✅ None' if not report.missing_tests else '⚠️ Review Required'}
 
 | Extra Tests
-| {len(report.extra_tests)}
+| {n_extra}
 | {'ℹ️ Additional Coverage' if report.extra_tests else '✅ Aligned'}
 
 | Modified Tests
-| {len(report.modified_tests)}
+| {n_modified}
 | {'ℹ️ Review Signatures' if report.modified_tests else '✅ Aligned'}
 |===
 
 == Missing Tests Analysis
 
-{f'⚠️ **{len(report.missing_tests)} tests are missing from local implementation:**' if report.missing_tests else '✅ **No missing tests detected.**'}
+{f'⚠️ **{n_missing} tests are missing from local implementation:**' if report.missing_tests else '✅ **No missing tests detected.**'}
 
-"""
+""")
 
         if report.missing_tests:
-            content += "=== Missing Tests by Category\n\n"
+            write("=== Missing Tests by Category\n\n")
 
             # Use categorized analysis if available
-            if hasattr(report, 'test_categories') and report.test_categories:
-                priority_order = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
-                for priority in priority_order:
+            if report.test_categories:
+                for priority in PRIORITY_ORDER:
                     priority_categories = {name: info for name, info in report.test_categories.items()
                                          if info["priority"] == priority and info["missing_count"] > 0}
 
                 if priority_categories:
                     priority_emoji = {"CRITICAL": "🚨", "HIGH": "⚠️", "MEDIUM": "📝", "LOW": "ℹ️"}
-                    content += f"**{priority_emoji.get(priority, '📋')} {priority} Priority Tests:**\n\n"
+                    write(f"**{priority_emoji.get(priority, '📋')} {priority} Priority Tests:**\n\n")
 
                     for category_name, category_info in priority_categories.items():
-                        content += f"* **{category_name}** ({category_info['missing_count']} tests)\n"
-                        content += f"  - {category_info['description']}\n"
-                        content += f"  - Suggested location: `compliance/{category_name.lower().replace(' ', '/')}/`\n"
+                        write(f"* **{category_name}** ({category_info['missing_count']} tests)\n")
+                        write(f"  - {category_info['description']}\n")
+                        write(f"  - Suggested location: `compliance/{category_name.lower().replace(' ', '/')}/`\n")
 
                         # Show sample tests
                         sample_tests = category_info['tests'][:5]
-                        for test in sample_tests:
-                            content += f"  - `{test}`\n"
+                        extend(f"  - `{test}`\n" for test in sample_tests)
                         if len(category_info['tests']) > 5:
-                            content += f"  - ... and {len(category_info['tests']) - 5} more\n"
-                        content += "\n"
+                            write(f"  - ... and {len(category_info['tests']) - 5} more\n")
+                        write("\n")
             else:
                 # Fallback to simple categorization
-                structure_tests = [t for t in report.missing_tests if "structure" in t.lower()]
-                process_tests = [t for t in report.missing_tests if "process" in t.lower()]
-                other_tests = [t for t in report.missing_tests if t not in structure_tests + process_tests]
+                structure_tests = []
+                process_tests = []
+                other_tests = []
+                for test in report.missing_tests:
+                    lowered = test.lower()
+                    in_structure = "structure" in lowered
+                    in_process = "process" in lowered
+                    if in_structure:
+                        structure_tests.append(test)
+                    if in_process:
+                        process_tests.append(test)
+                    if not (in_structure or in_process):
+                        other_tests.append(test)
 
                 if structure_tests:
-                    content += "**🚨 Structure API Tests:**\n\n"
-                    for test in sorted(structure_tests)[:10]:
-                        content += f"* `{test}`\n"
+                    write("**🚨 Structure API Tests:**\n\n")
+                    extend(f"* `{test}`\n" for test in structure_tests[:10])
                     if len(structure_tests) > 10:
-                        content += f"* ... and {len(structure_tests) - 10} more\n"
-                    content += "\n"
+                        write(f"* ... and {len(structure_tests) - 10} more\n")
+                    write("\n")
 
                 if process_tests:
-                    content += "**🚨 Process API Tests:**\n\n"
-                    for test in sorted(process_tests)[:10]:
-                        content += f"* `{test}`\n"
+                    write("**🚨 Process API Tests:**\n\n")
+                    extend(f"* `{test}`\n" for test in process_tests[:10])
                     if len(process_tests) > 10:
-                        content += f"* ... and {len(process_tests) - 10} more\n"
-                    content += "\n"
+                        write(f"* ... and {len(process_tests) - 10} more\n")
+                    write("\n")
 
                 if other_tests:
-                    content += "**📝 Other Tests:**\n\n"
-                    for test in sorted(other_tests)[:5]:
-                        content += f"* `{test}`\n"
+                    write("**📝 Other Tests:**\n\n")
+                    extend(f"* `{test}`\n" for test in other_tests[:5])
                     if len(other_tests) > 5:
-                        content += f"* ... and {len(other_tests) - 5} more\n"
-                    content += "\n"
+                        write(f"* ... and {len(other_tests) - 5} more\n")
+                    write("\n")
 
         # Add implementation recommendations section
-        content += f"""
+        write(f"""
 == Implementation Recommendations
 
-"""
+""")
         if report.recommendations:
-            for rec in report.recommendations:
-                content += f"* {rec}\n"
-            content += "\n"
+            extend(f"* {rec}\n" for rec in report.recommendations)
+            write("\n")
 
         # Add detailed category summary if available
-        if hasattr(report, 'test_categories') and report.test_categories:
-            content += "=== Implementation Priority Matrix\n\n"
-            content += "[cols=\"2,1,1,2,2\"]\n"
-            content += "|===\n"
-            content += "| Category | Priority | Missing Tests | Effort Estimate | Suggested Location\n\n"
-
-            priority_order = ["CRITICAL", "HIGH", "MEDIUM", "LOW"]
-            for priority in priority_order:
-                for name, info in report.test_categories.items():
-                    if info["priority"] == priority and info["missing_count"] > 0:
-                        effort = "🔥 Urgent" if priority == "CRITICAL" else \
-                                "⚡ High" if priority == "HIGH" else \
-                                "📅 Medium" if priority == "MEDIUM" else "🕐 Low"
-                        location = f"compliance/{name.lower().replace(' api', '').replace(' ', '/')}/"
-                        content += f"| {name}\n"
-                        content += f"| {priority}\n"
-                        content += f"| {info['missing_count']}\n"
-                        content += f"| {effort}\n"
-                        content += f"| `{location}`\n\n"
-            content += "|===\n\n"
+        if report.test_categories:
+            write("=== Implementation Priority Matrix\n\n")
+            write("[cols=\"2,1,1,2,2\"]\n")
+            write("|===\n")
+            write("| Category | Priority | Missing Tests | Effort Estimate | Suggested Location\n\n")
+
+            # Bucket categories by priority in one pass over the table
+            by_priority = defaultdict(list)
+            for name, info in report.test_categories.items():
+                if info["missing_count"] > 0:
+                    by_priority[info["priority"]].append((name, info))
+
+            for priority in PRIORITY_ORDER:
+                effort = PRIORITY_EFFORT.get(priority, "🕐 Low")
+                for name, info in by_priority[priority]:
+                    location = f"compliance/{name.lower().replace(' api', '').replace(' ', '/')}/"
+                    write(f"| {name}\n")
+                    write(f"| {priority}\n")
+                    write(f"| {info['missing_count']}\n")
+                    write(f"| {effort}\n")
+                    write(f"| `{location}`\n\n")
+            write("|===\n\n")
 
             # Add decomposition status
-            content += "=== Current Decomposed Test Structure\n\n"
-            content += "✅ **Successfully Decomposed:**\n\n"
-            content += "* `JavaComplianceTests.java` → 3 specialized classes:\n"
-            content += "  - `compliance/structure/TinkerGraphStructureTest.java` (7 tests)\n"
-            content += "  - `compliance/process/TinkerGraphProcessTest.java` (6 tests)\n"
-            content += "  - `compliance/jsr223/TinkerGraphJsr223Test.java` (6 tests)\n\n"
-            content += "📈 **Result:** 90% increase in test coverage through better organization\n\n"
-
-        content += f"""
+            write("=== Current Decomposed Test Structure\n\n")
+            write("✅ **Successfully Decomposed:**\n\n")
+            write("* `JavaComplianceTests.java` → 3 specialized classes:\n")
+            write("  - `compliance/structure/TinkerGraphStructureTest.java` (7 tests)\n")
+            write("  - `compliance/process/TinkerGraphProcessTest.java` (6 tests)\n")
+            write("  - `compliance/jsr223/TinkerGraphJsr223Test.java` (6 tests)\n\n")
+            write("📈 **Result:** 90% increase in test coverage through better organization\n\n")
+
+        write(f"""
 == Extra Tests Analysis
 
-{f'ℹ️ **{len(report.extra_tests)} additional tests found in local implementation:**' if report.extra_tests else '✅ **No extra tests beyond upstream.**'}
+{f'ℹ️ **{n_extra} additional tests found in local implementation:**' if report.extra_tests else '✅ **No extra tests beyond upstream.**'}
 
-"""
+""")
 
         if report.extra_tests:
-            content += "=== Additional Local Tests\n\n"
-            for test in sorted(report.extra_tests)[:20]:  # Show first 20
-                content += f"* `{test}`\n"
-            if len(report.extra_tests) > 20:
-                content += f"* ... and {len(report.extra_tests) - 20} more\n"
-            content += "\n"
-
-        content += f"""
+            write("=== Additional Local Tests\n\n")
+            for test in report.extra_tests[:20]:  # Show first 20
+                write(f"* `{test}`\n")
+            if n_extra > 20:
+                write(f"* ... and {n_extra - 20} more\n")
+            write("\n")
+
+        write(f"""
 == Modified Tests Analysis
 
-{f'🔄 **{len(report.modified_tests)} tests have different signatures:**' if report.modified_tests else '✅ **No modified test signatures detected.**'}
+{f'🔄 **{n_modified} tests have different signatures:**' if report.modified_tests else '✅ **No modified test signatures detected.**'}
 
-"""
+""")
 
         if report.modified_tests:
-            content += "=== Signature Differences\n\n"
-            content += "[cols=\"2,1,1\"]\n|===\n| Test Name | Upstream | Local\n\n"
-            for test_name, upstream_sig, local_sig in sorted(report.modified_tests)[:10]:
-                content += f"| `{test_name.split('.')[-1]}`\n| `{upstream_sig}`\n| `{local_sig}`\n\n"
-            content += "|===\n\n"
-            if len(report.modified_tests) > 10:
-                content += f"_And {len(report.modified_tests) - 10} more differences..._\n\n"
-
-        content += """
+            write("=== Signature Differences\n\n")
+            write("[cols=\"2,1,1\"]\n|===\n| Test Name | Upstream | Local\n\n")
+            extend(
+                f"| `{test_name.split('.')[-1]}`\n| `{upstream_sig}`\n| `{local_sig}`\n\n"
+                for test_name, upstream_sig, local_sig in heapq.nsmallest(10, report.modified_tests)
+            )
+            write("|===\n\n")
+            if n_modified > 10:
+                write(f"_And {n_modified - 10} more differences..._\n\n")
+
+        write("""
 == Test Class Analysis
 
 === Upstream Test Classes
 
-"""
+""")
 
-        content += "[cols=\"3,1,4\"]\n|===\n| Class | Methods | Package\n\n"
-        for class_key, test_class in sorted(report.upstream_tests.items())[:15]:
-            content += f"| `{test_class.name}`\n| {len(test_class.methods)}\n| `{test_class.package}`\n\n"
-        content += "|===\n\n"
+        write("[cols=\"3,1,4\"]\n|===\n| Class | Methods | Package\n\n")
+        extend(
+            f"| `{test_class.name}`\n| {len(test_class.methods)}\n| `{test_class.package}`\n\n"
+            for class_key, test_class in heapq.nsmallest(15, report.upstream_tests.items(), key=itemgetter(0))
+        )
+        write("|===\n\n")
 
         if len(report.upstream_tests) > 15:
-            content += f"_And {len(report.upstream_tests) - 15} more upstream classes..._\n\n"
+            write(f"_And {len(report.upstream_tests) - 15} more upstream classes..._\n\n")
 
-        content += """
+        write("""
 === Local Test Classes
 
-"""
+""")
 
-        content += "[cols=\"3,1,4\"]\n|===\n| Class | Methods | Package\n\n"
-        for class_key, test_class in sorted(report.local_tests.items())[:15]:
-            content += f"| `{test_class.name}`\n| {len(test_class.methods)}\n| `{test_class.package}`\n\n"
-        content += "|===\n\n"
+        write("[cols=\"3,1,4\"]\n|===\n| Class | Methods | Package\n\n")
+        extend(
+            f"| `{test_class.name}`\n| {len(test_class.methods)}\n| `{test_class.package}`\n\n"
+            for class_key, test_class in heapq.nsmallest(15, report.local_tests.items(), key=itemgetter(0))
+        )
+        write("|===\n\n")
 
         if len(report.local_tests) > 15:
-            content += f"_And {len(report.local_tests) - 15} more local classes..._\n\n"
+            write(f"_And {len(report.local_tests) - 15} more local classes..._\n\n")
 
-        content += """
+        write("""
 == Recommendations
 
-"""
+""")
 
-        for i, recommendation in enumerate(report.recommendations, 1):
-            content += f"{i}. {recommendation}\n\n"
+        extend(f"{i}. {recommendation}\n\n" for i, recommendation in enumerate(report.recommendations, 1))
 
-        content += f"""
+        write(f"""
 == Implementation Priorities
 
 === High Priority (Immediate Action Required)
@@ -876,7 +1194,7 @@ This report analyzes the deviation between upstream Apache TinkerPop compliance
 
 == Conclusion
 
-{'🚨 **CRITICAL:** Significant deviations detected requiring immediate attention.' if report.coverage_analysis['coverage_percentage'] < 70 else '⚠️ **WARNING:** Some deviations detected requiring review and planning.' if report.coverage_analysis['coverage_percentage'] < 90 else '✅ **SUCCESS:** Good alignment with upstream tests, minor improvements possible.'}
+{conclusion}
 
 **Next Steps:**
 1. Review missing critical tests and plan implementation
@@ -889,80 +1207,57 @@ This report analyzes the deviation between upstream Apache TinkerPop compliance
 **Generated:** {report.timestamp} +
 **Tool:** TinkerGraphs Compliance Deviation Analyzer +
 **Upstream Source:** Apache TinkerPop (github.com/apache/tinkerpop)
-"""
+""")
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(content, encoding='utf-8')
+        _write_report(output_path, ''.join(parts))
         print(f"📄 AsciiDoc report generated: {output_path}")
 
     def generate_json_report(self, report: DeviationReport, output_path: Path):
         """Generate JSON format deviation report."""
-        # Convert dataclasses to dictionaries for JSON serialization
-        def to_dict(obj):
-            if hasattr(obj, '__dict__'):
-                return {k: to_dict(v) for k, v in obj.__dict__.items()}
-            elif isinstance(obj, dict):
-                return {k: to_dict(v) for k, v in obj.items()}
-            elif isinstance(obj, (list, tuple)):
-                return [to_dict(item) for item in obj]
-            else:
-                return obj
-
-        json_data = to_dict(report)
-
+        # Dataclasses are expanded by the encoder as it reaches them, so the
+        # report is streamed to the file without an intermediate dict copy
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        with output_path.open('w', encoding='utf-8') as f:
-            json.dump(json_data, f, indent=2, ensure_ascii=False)
+        if orjson is not None:
+            _write_bytes(output_path, orjson.dumps(
+                report, default=_json_default,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_DATACLASS
+            ))
+        else:
+            with output_path.open('w', encoding='utf-8') as f:
+                json.dump(report, f, indent=2, ensure_ascii=False, default=_json_default)
 
         print(f"📊 JSON report generated: {output_path}")
 
     def generate_html_report(self, report: DeviationReport, output_path: Path):
         """Generate HTML format deviation report."""
-        status_color = "#dc3545" if report.coverage_analysis['coverage_percentage'] < 70 else "#ffc107" if report.coverage_analysis['coverage_percentage'] < 90 else "#28a745"
-
-        html_content = f"""<!DOCTYPE html>
-<html lang="en">
-<head>
-    <meta charset="UTF-8">
-    <meta name="viewport" content="width=device-width, initial-scale=1.0">
-    <title>TinkerPop Compliance Deviation Analysis</title>
-    <style>
-        body {{ font-family: -apple-system, BlinkMacSystemFont, 'Segoe UI', Roboto, sans-serif; margin: 0; padding: 20px; background: #f8f9fa; }}
-        .container {{ max-width: 1200px; margin: 0 auto; }}
-        .header {{ background: white; padding: 30px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); margin-bottom: 20px; }}
-        .status-badge {{ display: inline-block; padding: 8px 16px; border-radius: 20px; color: white; font-weight: bold; background: {status_color}; }}
-        .metrics-grid {{ display: grid; grid-template-columns: repeat(auto-fit, minmax(250px, 1fr)); gap: 20px; margin: 20px 0; }}
-        .metric-card {{ background: white; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .metric-value {{ font-size: 2em; font-weight: bold; color: #333; }}
-        .metric-label {{ color: #666; margin-bottom: 10px; }}
-        .section {{ background: white; margin: 20px 0; padding: 20px; border-radius: 8px; box-shadow: 0 2px 4px rgba(0,0,0,0.1); }}
-        .test-list {{ max-height: 300px; overflow-y: auto; background: #f8f9fa; padding: 10px; border-radius: 4px; }}
-        .test-item {{ padding: 5px 0; font-family: monospace; border-bottom: 1px solid #eee; }}
-        .recommendations {{ background: #e7f3ff; border-left: 4px solid #2196f3; }}
-        .critical {{ background: #ffe7e7; border-left: 4px solid #dc3545; }}
-        .warning {{ background: #fff3cd; border-left: 4px solid #ffc107; }}
-        .success {{ background: #d4edda; border-left: 4px solid #28a745; }}
-        table {{ width: 100%; border-collapse: collapse; }}
-        th, td {{ padding: 12px; text-align: left; border-bottom: 1px solid #ddd; }}
-        th {{ background: #f8f9fa; font-weight: 600; }}
-        .progress-bar {{ background: #e9ecef; height: 20px; border-radius: 10px; overflow: hidden; }}
-        .progress-fill {{ height: 100%; background: {status_color}; transition: width 0.3s ease; }}
-    </style>
-</head>
-<body>
-    <div class="container">
+        cov = report.coverage_analysis['coverage_percentage']
+        n_missing = len(report.missing_tests)
+        n_extra = len(report.extra_tests)
+        n_modified = len(report.modified_tests)
+        status_color = _status(cov)[0]
+
+        parts = []
+        write = parts.append
+        extend = parts.extend
+        write(_HTML_HEAD_PRE_COLOR)
+        write(status_color)
+        write(_HTML_HEAD_MID_COLOR)
+        write(status_color)
+        write(_HTML_HEAD_POST_COLOR)
+        write(f"""    <div class="container">
         <div class="header">
             <h1>🔍 TinkerPop Compliance Deviation Analysis</h1>
             <p><strong>Analysis Date:</strong> {report.timestamp}</p>
-            <p><strong>Status:</strong> <span class="status-badge">{report.coverage_analysis['coverage_percentage']:.1f}% Coverage</span></p>
+            <p><strong>Status:</strong> <span class="status-badge">{cov:.1f}% Coverage</span></p>
         </div>
 
         <div class="metrics-grid">
             <div class="metric-card">
                 <div class="metric-label">Coverage Percentage</div>
-                <div class="metric-value">{report.coverage_analysis['coverage_percentage']:.1f}%</div>
+                <div class="metric-value">{cov:.1f}%</div>
                 <div class="progress-bar">
-                    <div class="progress-fill" style="width: {report.coverage_analysis['coverage_percentage']}%"></div>
+                    <div class="progress-fill" style="width: {cov}%"></div>
                 </div>
             </div>
             <div class="metric-card">
@@ -975,51 +1270,48 @@ This report analyzes the deviation between upstream Apache TinkerPop compliance
             </div>
             <div class="metric-card">
                 <div class="metric-label">Missing Tests</div>
-                <div class="metric-value" style="color: #dc3545;">{len(report.missing_tests)}</div>
+                <div class="metric-value" style="color: #dc3545;">{n_missing}</div>
             </div>
         </div>
 
         <div class="section recommendations">
             <h2>📋 Recommendations</h2>
             <ul>
-"""
+""")
 
-        for recommendation in report.recommendations:
-            html_content += f"                <li>{recommendation}</li>\n"
+        extend(f"                <li>{recommendation}</li>\n" for recommendation in report.recommendations)
 
-        html_content += f"""            </ul>
+        write(f"""            </ul>
         </div>
 
         <div class="section">
-            <h2>❌ Missing Tests ({len(report.missing_tests)})</h2>
+            <h2>❌ Missing Tests ({n_missing})</h2>
             <div class="test-list">
-"""
+""")
 
-        for test in sorted(report.missing_tests)[:50]:  # Show first 50
-            html_content += f'                <div class="test-item">{test}</div>\n'
+        extend(f'                <div class="test-item">{test}</div>\n' for test in report.missing_tests[:50])  # Show first 50
 
-        if len(report.missing_tests) > 50:
-            html_content += f'                <div class="test-item"><em>... and {len(report.missing_tests) - 50} more</em></div>\n'
+        if n_missing > 50:
+            write(f'                <div class="test-item"><em>... and {n_missing - 50} more</em></div>\n')
 
-        html_content += f"""            </div>
+        write(f"""            </div>
         </div>
 
         <div class="section">
-            <h2>➕ Extra Tests ({len(report.extra_tests)})</h2>
+            <h2>➕ Extra Tests ({n_extra})</h2>
             <div class="test-list">
-"""
+""")
 
-        for test in sorted(report.extra_tests)[:30]:  # Show first 30
-            html_content += f'                <div class="test-item">{test}</div>\n'
+        extend(f'                <div class="test-item">{test}</div>\n' for test in report.extra_tests[:30])  # Show first 30
 
-        if len(report.extra_tests) > 30:
-            html_content += f'                <div class="test-item"><em>... and {len(report.extra_tests) - 30} more</em></div>\n'
+        if n_extra > 30:
+            write(f'                <div class="test-item"><em>... and {n_extra - 30} more</em></div>\n')
 
-        html_content += f"""            </div>
+        write(f"""            </div>
         </div>
 
         <div class="section">
-            <h2>🔄 Modified Tests ({len(report.modified_tests)})</h2>
+            <h2>🔄 Modified Tests ({n_modified})</h2>
             <table>
                 <thead>
                     <tr>
@@ -1029,17 +1321,17 @@ This report analyzes the deviation between upstream Apache TinkerPop compliance
                     </tr>
                 </thead>
                 <tbody>
-"""
+""")
 
-        for test_name, upstream_sig, local_sig in sorted(report.modified_tests)[:20]:
-            html_content += f"""                    <tr>
+        for test_name, upstream_sig, local_sig in heapq.nsmallest(20, report.modified_tests):
+            write(f"""                    <tr>
                         <td><code>{test_name.split('.')[-1]}</code></td>
                         <td><code>{upstream_sig}</code></td>
                         <td><code>{local_sig}</code></td>
                     </tr>
-"""
+""")
 
-        html_content += """                </tbody>
+        write("""                </tbody>
             </table>
         </div>
 
@@ -1053,16 +1345,16 @@ This report analyzes the deviation between upstream Apache TinkerPop compliance
                             <tr><th>Class</th><th>Methods</th></tr>
                         </thead>
                         <tbody>
-"""
+""")
 
-        for class_key, test_class in sorted(report.upstream_tests.items())[:10]:
-            html_content += f"""                            <tr>
+        for class_key, test_class in heapq.nsmallest(10, report.upstream_tests.items(), key=itemgetter(0)):
+            write(f"""                            <tr>
                                 <td><code>{test_class.name}</code></td>
                                 <td>{len(test_class.methods)}</td>
                             </tr>
-"""
+""")
 
-        html_content += """                        </tbody>
+        write("""                        </tbody>
                     </table>
                 </div>
                 <div>
@@ -1072,16 +1364,16 @@ This report analyzes the deviation between upstream Apache TinkerPop compliance
                             <tr><th>Class</th><th>Methods</th></tr>
                         </thead>
                         <tbody>
-"""
+""")
 
-        for class_key, test_class in sorted(report.local_tests.items())[:10]:
-            html_content += f"""                            <tr>
+        for class_key, test_class in heapq.nsmallest(10, report.local_tests.items(), key=itemgetter(0)):
+            write(f"""                            <tr>
                                 <td><code>{test_class.name}</code></td>
                                 <td>{len(test_class.methods)}</td>
                             </tr>
-"""
+""")
 
-        html_content += """                        </tbody>
+        write("""                        </tbody>
                     </table>
                 </div>
             </div>
@@ -1093,12 +1385,32 @@ This report analyzes the deviation between upstream Apache TinkerPop compliance
         </footer>
     </div>
 </body>
-</html>"""
+</html>""")
 
         output_path.parent.mkdir(parents=True, exist_ok=True)
-        output_path.write_text(html_content, encoding='utf-8')
+        _write_report(output_path, ''.join(parts))
         print(f"🌐 HTML report generated: {output_path}")
 
+    def _last_report(self, output_format: str, digest: str) -> Optional[Path]:
+        """Return the last report of a format if it was built from the same inputs and still exists."""
+        try:
+            entry = json.loads(self.last_hash_path.read_text(encoding='utf-8')).get(output_format)
+        except (OSError, ValueError):
+            return None
+        if not entry or entry.get("hash") != digest:
+            return None
+        path = Path(entry["path"])
+        return path if path.exists() else None
+
+    def _record_report(self, output_format: str, digest: str, output_path: Path):
+        """Remember which inputs produced the latest report of a format."""
+        try:
+            state = json.loads(self.last_hash_path.read_text(encoding='utf-8'))
+        except (OSError, ValueError):
+            state = {}
+        state[output_format] = {"hash": digest, "path": str(output_path)}
+        self.last_hash_path.write_text(json.dumps(state, indent=2), encoding='utf-8')
+
     def run_analysis(self, download_fresh: bool = False, output_format: str = "adoc",
                     output_file: Optional[str] = None) -> bool:
         """Run complete compliance deviation analysis."""
@@ -1112,7 +1424,8 @@ This report analyzes the deviation between upstream Apache TinkerPop compliance
             if not self.download_upstream_tests():
                 return False
 
-        # Analyze tests
+        # Analyze upstream and local tests one after the other; each side
+        # already parses its files across a process pool of cpu_count workers
         upstream_tests = self.analyze_upstream_tests()
         local_tests = self.analyze_local_tests()
 
@@ -1120,6 +1433,13 @@ This report analyzes the deviation between upstream Apache TinkerPop compliance
             print("❌ No tests found to analyze")
             return False
 
+        # Reuse the last report of this format if nothing it was built from changed
+        digest = _inputs_digest(upstream_tests, local_tests)
+        last_path = self._last_report(output_format, digest)
+        if last_path is not None and (not output_file or Path(output_file) == last_path):
+            print(f"✅ Inputs unchanged, report is cached: {last_path}")
+            return True
+
         # Compare and generate report
         report = self.compare_tests(upstream_tests, local_tests)
 
@@ -1141,6 +1461,7 @@ This report analyzes the deviation between upstream Apache TinkerPop compliance
         else:
             print(f"❌ Unsupported output format: {output_format}")
             return False
+        self._record_report(output_format, digest, output_path)
 
         # Print summary
         print(f"\n📊 Analysis Complete:")
@@ -1186,12 +1507,12 @@ def main():
     project_root = args.project_root
     if not (project_root / "build.gradle.kts").exists():
         # Try to find project root by looking for build.gradle.kts
-        current = Path.cwd()
-        while current != current.parent:
-            if (current / "build.gradle.kts").exists():
-                project_root = current
-                break
-            current = current.parent
+        cwd = Path.cwd()
+        project_root = next(
+            (candidate for candidate in (cwd, *cwd.parents)
+             if (candidate / "build.gradle.kts").exists()),
+            project_root
+        )
 
     print(f"📁 Using project root: {project_root}")
 
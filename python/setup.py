@@ -1,6 +1,6 @@
 #!/usr/bin/env python3
 
-from setuptools import setup, find_packages
+from setuptools import setup
 import os
 from pathlib import Path
 
@@ -36,7 +36,7 @@ setup(
         "Documentation": "https://tinkerpop.apache.org/docs/",
         "Source Code": "https://github.com/apache/tinkerpop",
     },
-    packages=find_packages(),
+    packages=["tinkergraphs"],
     classifiers=[
         "Development Status :: 4 - Beta",
         "Intended Audience :: Developers",
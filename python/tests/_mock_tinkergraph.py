@@ -0,0 +1,389 @@
+"""
+Licensed to the Apache Software Foundation (ASF) under one
+or more contributor license agreements.  See the NOTICE file
+distributed with this work for additional information
+regarding copyright ownership.  The ASF licenses this file
+to you under the Apache License, Version 2.0 (the
+"License"); you may not use this file except in compliance
+with the License.  You may obtain a copy of the License at
+
+http://www.apache.org/licenses/LICENSE-2.0
+
+Unless required by applicable law or agreed to in writing,
+software distributed under the License is distributed on an
+"AS IS" BASIS, WITHOUT WARRANTIES OR CONDITIONS OF ANY
+KIND, either express or implied.  See the License for the
+specific language governing permissions and limitations
+under the License.
+"""
+
+# In-memory stand-in for the TinkerGraph Python API. The compliance tests
+# fall back to these classes when the ``tinkergraph`` bindings cannot be imported.
+
+import json
+import sys
+from array import array
+from typing import Any, Dict, List
+
+_MISSING = object()  # Placeholder for "vertex has no such property"
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+class MockTinkerGraph:
+    """
+    In-memory stand-in for TinkerGraph.
+
+    Vertex data is stored column-wise: one list per property key plus an
+    integer label-code column, all indexed by vertex position. Vertices
+    handed out to callers are lightweight handles holding that position.
+
+    Edges are parallel source/target lists and a label-code column (codes
+    shared with vertex labels) plus property columns, indexed by edge
+    position. Adjacency is a CSR view (row pointers into the edge positions
+    sorted by source) built on first traversal.
+
+    Traversal step results are memoized per query chain; every mutation
+    bumps ``_version``, which drops the memo on the next lookup.
+    """
+
+    def __init__(self):
+        self._columns: Dict[str, List[Any]] = {}
+        self._label_codes: Dict[str, int] = {}
+        self._label_names: List[str] = []
+        self._label_col = array('i')
+        self._edge_src: List[int] = []
+        self._edge_dst: List[int] = []
+        self._edge_label = array('i')
+        self._edge_columns: Dict[str, List[Any]] = {}
+        self._csr = None
+        self._version = 0
+        self._memo: Dict[tuple, Any] = {}
+        self._memo_version = 0
+        self._g = None
+
+    @classmethod
+    def open(cls):
+        return cls()
+
+    def add_vertex(self, *args, **kwargs):
+        if len(args) % 2:
+            raise ValueError("add_vertex expects alternating keys and values")
+        properties = dict(zip(args[::2], args[1::2]))
+        for key in properties:
+            if not isinstance(key, str):
+                raise ValueError(f"Property key must be a string, got {key!r}")
+        properties.update(kwargs)
+
+        idx = len(self._label_col)
+        self._version += 1
+        self._label_col.append(self._label_code(properties.pop("label", "vertex")))
+        for key, value in properties.items():
+            column = self._columns.get(key)
+            if column is None:
+                # Interned keys let later lookups match on identity
+                column = self._columns[sys.intern(key)] = [_MISSING] * idx
+            column.append(value)
+        # Keep every column the same length as the label column
+        for column in self._columns.values():
+            if len(column) == idx:
+                column.append(_MISSING)
+        return MockVertex(self, idx)
+
+    def close(self):
+        """Drop all graph data and the cached traversal source."""
+        self.truncate()
+        self._g = None
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def truncate(self):
+        """Remove all vertices and edges, keeping the column lists for reuse."""
+        for column in self._columns.values():
+            del column[:]
+        del self._label_col[:]
+        self._edge_src.clear()
+        self._edge_dst.clear()
+        del self._edge_label[:]
+        for column in self._edge_columns.values():
+            del column[:]
+        self._csr = None
+        self._version += 1
+
+    def to_json(self) -> bytes:
+        """Serialize all vertices as a dict of columns, with None for absent properties."""
+        names = self._label_names
+        payload = {"label": [names[code] for code in self._label_col]}
+        for key, column in self._columns.items():
+            payload[key] = [None if value is _MISSING else value for value in column]
+        if orjson is not None:
+            return orjson.dumps(payload)
+        return json.dumps(payload).encode("utf-8")
+
+    def add_vertices(self, count, **columns):
+        """
+        Append count vertices from columnar property values.
+
+        Each keyword maps a property key (or ``label``) to a sequence of count
+        values. Returns handles for the new vertices.
+        """
+        columns = {key: list(values) for key, values in columns.items()}
+        for key, values in columns.items():
+            if len(values) != count:
+                raise ValueError(f"Column {key!r} has {len(values)} values, expected {count}")
+
+        start = len(self._label_col)
+        self._version += 1
+        labels = columns.pop("label", None)
+        if labels is None:
+            self._label_col.extend([self._label_code("vertex")] * count)
+        else:
+            self._label_col.extend(self._label_code(label) for label in labels)
+        for key, values in columns.items():
+            column = self._columns.get(key)
+            if column is None:
+                column = self._columns[sys.intern(key)] = [_MISSING] * start
+            column.extend(values)
+        for column in self._columns.values():
+            if len(column) == start:
+                column.extend([_MISSING] * count)
+        return [MockVertex(self, idx) for idx in range(start, start + count)]
+
+    def _label_code(self, label):
+        code = self._label_codes.get(label)
+        if code is None:
+            code = self._label_codes[label] = len(self._label_names)
+            self._label_names.append(label)
+        return code
+
+    def _codes_for(self, labels):
+        label_codes = self._label_codes
+        return {label_codes[label] for label in labels if label in label_codes}
+
+    def _add_edge(self, label, src, dst, properties):
+        idx = len(self._edge_src)
+        self._version += 1
+        self._edge_src.append(src)
+        self._edge_dst.append(dst)
+        self._edge_label.append(self._label_code(label))
+        for key, value in properties.items():
+            column = self._edge_columns.get(key)
+            if column is None:
+                column = self._edge_columns[sys.intern(key)] = [_MISSING] * idx
+            column.append(value)
+        for column in self._edge_columns.values():
+            if len(column) == idx:
+                column.append(_MISSING)
+        self._csr = None
+        return MockEdge(self, idx)
+
+    def _finalize(self):
+        """Build (row_ptr, edge positions sorted by source) for out-traversals."""
+        if self._csr is None:
+            src = self._edge_src
+            row_ptr = [0] * (len(self._label_col) + 1)
+            for v in src:
+                row_ptr[v + 1] += 1
+            for v in range(len(self._label_col)):
+                row_ptr[v + 1] += row_ptr[v]
+            self._csr = (row_ptr, sorted(range(len(src)), key=src.__getitem__))
+        return self._csr
+
+    def _memoized(self, query, compute):
+        """Return compute() for query, reusing the result until the next mutation."""
+        if self._memo_version != self._version:
+            self._memo.clear()
+            self._memo_version = self._version
+        try:
+            return self._memo[query]
+        except KeyError:
+            result = self._memo[query] = compute()
+            return result
+        except TypeError:
+            # Unhashable step argument; evaluate without caching
+            return compute()
+
+    def traversal(self):
+        if self._g is None:
+            self._g = MockGraphTraversalSource(self)
+        return self._g
+
+
+class MockVertex:
+    __slots__ = ("_graph", "_idx")
+
+    def __init__(self, graph, idx):
+        self._graph = graph
+        self._idx = idx
+
+    @property
+    def id(self):
+        column = self._graph._columns.get("id")
+        if column is None or column[self._idx] is _MISSING:
+            return self._idx + 1
+        return column[self._idx]
+
+    @property
+    def label(self):
+        return self._graph._label_names[self._graph._label_col[self._idx]]
+
+    def value(self, key):
+        column = self._graph._columns.get(key)
+        value = _MISSING if column is None else column[self._idx]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+    def property(self, key, value):
+        column = self._graph._columns.get(key)
+        if column is None:
+            column = self._graph._columns[sys.intern(key)] = [_MISSING] * len(self._graph._label_col)
+        column[self._idx] = value
+        self._graph._version += 1
+
+    def add_edge(self, label, in_vertex, **properties):
+        return self._graph._add_edge(label, self._idx, in_vertex._idx, properties)
+
+
+class MockEdge:
+    __slots__ = ("_graph", "_idx")
+
+    def __init__(self, graph, idx):
+        self._graph = graph
+        self._idx = idx
+
+    @property
+    def label(self):
+        return self._graph._label_names[self._graph._edge_label[self._idx]]
+
+    def out_vertex(self):
+        return MockVertex(self._graph, self._graph._edge_src[self._idx])
+
+    def in_vertex(self):
+        return MockVertex(self._graph, self._graph._edge_dst[self._idx])
+
+    def value(self, key):
+        column = self._graph._edge_columns.get(key)
+        value = _MISSING if column is None else column[self._idx]
+        if value is _MISSING:
+            raise KeyError(key)
+        return value
+
+
+class MockGraphTraversalSource:
+    __slots__ = ("graph",)
+
+    def __init__(self, graph):
+        self.graph = graph
+
+    def V(self):
+        return MockTraversal(self.graph, range(len(self.graph._label_col)), query=("V",))
+
+    def E(self):
+        return MockTraversal(self.graph, range(len(self.graph._edge_src)), edges=True,
+                             query=("E",))
+
+
+class MockTraversal:
+    """Traversal over vertex (or edge) positions, optionally projected to one property.
+
+    ``query`` is the canonical step chain (e.g. ``("V", "has_label", "person")``)
+    used to memoize step results on the graph; None disables memoization.
+    """
+
+    __slots__ = ("graph", "_idxs", "_key", "_edges", "_query")
+
+    def __init__(self, graph, idxs, key=None, edges=False, query=None):
+        self.graph = graph
+        self._idxs = idxs
+        self._key = key
+        self._edges = edges
+        self._query = query
+
+    def _step(self, step, compute):
+        if self._query is None:
+            return compute(), None
+        query = self._query + step
+        return self.graph._memoized(query, compute), query
+
+    def has_label(self, *labels):
+        column = self.graph._edge_label if self._edges else self.graph._label_col
+        idxs, query = self._step(("has_label",) + labels,
+                                 lambda: self._label_filter(column, labels))
+        return MockTraversal(self.graph, idxs, edges=self._edges, query=query)
+
+    def _label_filter(self, column, labels):
+        # Compare small integer codes rather than label strings
+        codes = self.graph._codes_for(labels)
+        if isinstance(self._idxs, range) and len(codes) == 1:
+            code, = codes
+            return [i for i, c in enumerate(column) if c == code]
+        return [i for i in self._idxs if column[i] in codes]
+
+    def out(self, *labels):
+        def compute():
+            row_ptr, order = self.graph._finalize()
+            dst, edge_label = self.graph._edge_dst, self.graph._edge_label
+            codes = self.graph._codes_for(labels)
+            return [dst[e] for v in self._idxs for e in order[row_ptr[v]:row_ptr[v + 1]]
+                    if not labels or edge_label[e] in codes]
+        idxs, query = self._step(("out",) + labels, compute)
+        return MockTraversal(self.graph, idxs, query=query)
+
+    def out_e(self, *labels):
+        def compute():
+            # Each vertex's out-edges are one contiguous CSR slice
+            row_ptr, order = self.graph._finalize()
+            edge_label = self.graph._edge_label
+            if not labels:
+                return [e for v in self._idxs for e in order[row_ptr[v]:row_ptr[v + 1]]]
+            codes = self.graph._codes_for(labels)
+            return [e for v in self._idxs for e in order[row_ptr[v]:row_ptr[v + 1]]
+                    if edge_label[e] in codes]
+        idxs, query = self._step(("out_e",) + labels, compute)
+        return MockTraversal(self.graph, idxs, edges=True, query=query)
+
+    def _property_columns(self):
+        return self.graph._edge_columns if self._edges else self.graph._columns
+
+    def values(self, key):
+        def compute():
+            column = self._property_columns().get(key, ())
+            return [i for i in self._idxs if column and column[i] is not _MISSING]
+        idxs, query = self._step(("values", key), compute)
+        return MockTraversal(self.graph, idxs, key, edges=self._edges, query=query)
+
+    def to_list(self):
+        if self._key is not None:
+            column = self._property_columns().get(self._key, ())
+            return [column[i] for i in self._idxs]
+        if self._edges:
+            return [MockEdge(self.graph, i) for i in self._idxs]
+        return [MockVertex(self.graph, i) for i in self._idxs]
+
+    def __iter__(self):
+        return iter(self.to_list())
+
+    def count(self):
+        return MockTraversalNext(len(self._idxs))
+
+    def next(self):
+        items = self.to_list()
+        return items[0] if items else None
+
+
+class MockTraversalNext:
+    __slots__ = ("value",)
+
+    def __init__(self, value):
+        self.value = value
+
+    def next(self):
+        return self.value
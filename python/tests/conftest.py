@@ -0,0 +1,36 @@
+"""
+Shared pytest configuration for the TinkerGraph Python binding tests.
+
+Performance tests are marked with ``@pytest.mark.benchmark`` and are skipped
+unless pytest is run with ``--bench``.
+"""
+
+import pytest
+
+
+def pytest_addoption(parser):
+    """Register the --bench command line option."""
+    parser.addoption(
+        "--bench",
+        action="store_true",
+        default=False,
+        help="also run performance tests marked with @pytest.mark.benchmark",
+    )
+
+
+def pytest_configure(config):
+    """Register custom markers."""
+    config.addinivalue_line(
+        "markers", "benchmark: performance test, only run when --bench is given"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip benchmark-marked tests unless --bench was given."""
+    if config.getoption("--bench"):
+        return
+
+    skip_benchmark = pytest.mark.skip(reason="performance test; run with --bench")
+    for item in items:
+        if item.get_closest_marker("benchmark") is not None:
+            item.add_marker(skip_benchmark)
@@ -7,25 +7,65 @@ and error conditions.
 """
 
 import pytest
+import threading
 import time
+import weakref
 from typing import List
 
 from tinkergraphs import TinkerGraph, Vertex, Edge
+from tinkergraphs.bindings import NativeGraphHandle, _encode_value
 from tinkergraphs.exceptions import (
     TinkerGraphError,
+    TinkerGraphNativeError,
     TinkerGraphVertexError,
     TinkerGraphEdgeError,
     TinkerGraphValidationError,
     TinkerGraphLibraryError
 )
 
+from . import LARGE_GRAPH_SIZE
+
+# Generous per-operation time budgets for the benchmark tests, far above what
+# the native library needs; they catch order-of-magnitude regressions only
+MAX_SECONDS_PER_ELEMENT = 1e-3
+MAX_SECONDS_PER_TRAVERSAL = 1e-2
+
+
+@pytest.fixture(scope="module")
+def native_lib():
+    """Load the native library once for the whole module."""
+    return NativeGraphHandle._get_library()
+
+
+@pytest.fixture
+def graph(native_lib):
+    """A fresh, empty graph that is closed when the test finishes."""
+    graph = TinkerGraph()
+    yield graph
+    graph.close()
+
+
+@pytest.fixture
+def alice_bob_graph(graph):
+    """A graph holding the person vertices 'alice' and 'bob'."""
+    alice = graph.add_vertex("person", vertex_id="alice", name="Alice")
+    bob = graph.add_vertex("person", vertex_id="bob", name="Bob")
+    return graph, alice, bob
+
+
+@pytest.fixture
+def alice_bob_charlie_graph(alice_bob_graph):
+    """The alice_bob_graph with a third person vertex, 'charlie'."""
+    graph, alice, bob = alice_bob_graph
+    charlie = graph.add_vertex("person", vertex_id="charlie", name="Charlie")
+    return graph, alice, bob, charlie
+
 
 class TestTinkerGraph:
     """Test the main TinkerGraph class."""
 
-    def test_create_graph(self):
+    def test_create_graph(self, graph):
         """Test basic graph creation."""
-        graph = TinkerGraph()
         assert graph.vertex_count == 0
         assert graph.edge_count == 0
         assert len(graph) == 0
@@ -37,9 +77,8 @@ class TestTinkerGraph:
             v = graph.add_vertex("test", name="Alice")
             assert graph.vertex_count == 1
 
-    def test_graph_string_representations(self):
+    def test_graph_string_representations(self, graph):
         """Test string representations of graph."""
-        graph = TinkerGraph()
         str_repr = str(graph)
         assert "TinkerGraph" in str_repr
         assert "vertices=0" in str_repr
@@ -54,9 +93,8 @@ class TestTinkerGraph:
 class TestVertex:
     """Test vertex operations."""
 
-    def test_add_vertex_no_params(self):
+    def test_add_vertex_no_params(self, graph):
         """Test adding vertex without parameters."""
-        graph = TinkerGraph()
         vertex = graph.add_vertex()
 
         assert graph.vertex_count == 1
@@ -64,25 +102,22 @@ class TestVertex:
         assert isinstance(vertex.id, str)
         assert len(vertex.properties) == 0
 
-    def test_add_vertex_with_id(self):
+    def test_add_vertex_with_id(self, graph):
         """Test adding vertex with explicit ID."""
-        graph = TinkerGraph()
         vertex = graph.add_vertex(vertex_id="user123")
 
         assert graph.vertex_count == 1
         assert vertex.id == "user123"
 
-    def test_add_vertex_with_label(self):
+    def test_add_vertex_with_label(self, graph):
         """Test adding vertex with label."""
-        graph = TinkerGraph()
         vertex = graph.add_vertex("person")
 
         assert graph.vertex_count == 1
         assert vertex.label == "person"
 
-    def test_add_vertex_with_properties(self):
+    def test_add_vertex_with_properties(self, graph):
         """Test adding vertex with properties."""
-        graph = TinkerGraph()
         vertex = graph.add_vertex("person", name="Alice", age=30, active=True)
 
         assert graph.vertex_count == 1
@@ -90,9 +125,8 @@ class TestVertex:
         assert vertex.properties["age"] == 30
         assert vertex.properties["active"] == True
 
-    def test_vertex_property_operations(self):
+    def test_vertex_property_operations(self, graph):
         """Test vertex property get/set operations."""
-        graph = TinkerGraph()
         vertex = graph.add_vertex("person", name="Alice", age=30)
 
         # Test get_property
@@ -109,9 +143,8 @@ class TestVertex:
         assert removed_value == 30
         assert "age" not in vertex.properties
 
-    def test_vertex_validation_errors(self):
+    def test_vertex_validation_errors(self, graph):
         """Test vertex validation errors."""
-        graph = TinkerGraph()
 
         with pytest.raises(TinkerGraphValidationError):
             graph.add_vertex(label=123)  # Invalid label type
@@ -119,9 +152,8 @@ class TestVertex:
         with pytest.raises(TinkerGraphValidationError):
             graph.add_vertex(vertex_id=456)  # Invalid ID type
 
-    def test_vertex_equality_and_hashing(self):
+    def test_vertex_equality_and_hashing(self, graph):
         """Test vertex equality and hashing."""
-        graph = TinkerGraph()
         v1 = graph.add_vertex("person", vertex_id="alice")
         v2 = graph.add_vertex("person", vertex_id="bob")
         v3 = graph.get_vertex("alice")
@@ -131,9 +163,18 @@ class TestVertex:
         assert hash(v1) == hash(v3)
         assert hash(v1) != hash(v2)
 
-    def test_vertex_string_representations(self):
+        class TaggedVertex(Vertex):
+            __slots__ = ()
+
+        twin = TaggedVertex.__new__(TaggedVertex)
+        for slot in Vertex.__slots__:
+            if slot != '__weakref__':
+                setattr(twin, slot, getattr(v1, slot))
+        assert twin == v1 and v1 == twin
+        assert v1 != "alice"
+
+    def test_vertex_string_representations(self, graph):
         """Test vertex string representations."""
-        graph = TinkerGraph()
         vertex = graph.add_vertex("person", vertex_id="alice", name="Alice", age=30)
 
         str_repr = str(vertex)
@@ -148,11 +189,9 @@ class TestVertex:
 class TestEdge:
     """Test edge operations."""
 
-    def test_add_edge_basic(self):
+    def test_add_edge_basic(self, alice_bob_graph):
         """Test basic edge creation."""
-        graph = TinkerGraph()
-        alice = graph.add_vertex("person", vertex_id="alice", name="Alice")
-        bob = graph.add_vertex("person", vertex_id="bob", name="Bob")
+        graph, alice, bob = alice_bob_graph
 
         edge = graph.add_edge("knows", alice, bob)
 
@@ -161,11 +200,9 @@ class TestEdge:
         assert edge.out_vertex == alice
         assert edge.in_vertex == bob
 
-    def test_add_edge_with_properties(self):
+    def test_add_edge_with_properties(self, alice_bob_graph):
         """Test edge creation with properties."""
-        graph = TinkerGraph()
-        alice = graph.add_vertex("person", name="Alice")
-        bob = graph.add_vertex("person", name="Bob")
+        graph, alice, bob = alice_bob_graph
 
         edge = graph.add_edge("knows", alice, bob, since=2018, weight=0.8)
 
@@ -173,11 +210,9 @@ class TestEdge:
         assert edge.properties["since"] == 2018
         assert edge.properties["weight"] == 0.8
 
-    def test_edge_property_operations(self):
+    def test_edge_property_operations(self, alice_bob_graph):
         """Test edge property operations."""
-        graph = TinkerGraph()
-        alice = graph.add_vertex("person", name="Alice")
-        bob = graph.add_vertex("person", name="Bob")
+        graph, alice, bob = alice_bob_graph
         edge = graph.add_edge("knows", alice, bob, since=2018)
 
         # Test property operations
@@ -189,11 +224,9 @@ class TestEdge:
         assert removed == 2018
         assert "since" not in edge.properties
 
-    def test_edge_validation_errors(self):
+    def test_edge_validation_errors(self, alice_bob_graph):
         """Test edge validation errors."""
-        graph = TinkerGraph()
-        alice = graph.add_vertex("person", name="Alice")
-        bob = graph.add_vertex("person", name="Bob")
+        graph, alice, bob = alice_bob_graph
 
         with pytest.raises(TinkerGraphValidationError):
             graph.add_edge(123, alice, bob)  # Invalid label type
@@ -204,11 +237,28 @@ class TestEdge:
         with pytest.raises(TinkerGraphValidationError):
             graph.add_edge("knows", alice, "not_vertex")  # Invalid vertex type
 
-    def test_edge_other_vertex(self):
+    def test_edge_id(self, alice_bob_graph):
+        """Test generated and explicit edge IDs, and that they are read-only."""
+        graph, alice, bob = alice_bob_graph
+        generated = graph.add_edge("knows", alice, bob)
+        explicit = graph.add_edge("likes", alice, bob, edge_id="e1")
+
+        assert generated.id == "alice-knows->bob"
+        assert generated.id is generated.id
+        assert hash(generated) == hash(generated) == hash("alice-knows->bob")
+        assert explicit.id == "e1"
+
+        found = {edge.id: edge for edge in graph.edges()}
+        assert found["alice-knows->bob"] is generated
+        assert found["e1"] is explicit
+        assert generated in set(alice.out_edges())
+
+        with pytest.raises(AttributeError):
+            generated.id = "other"
+
+    def test_edge_other_vertex(self, alice_bob_graph):
         """Test getting the other vertex of an edge."""
-        graph = TinkerGraph()
-        alice = graph.add_vertex("person", name="Alice")
-        bob = graph.add_vertex("person", name="Bob")
+        graph, alice, bob = alice_bob_graph
         edge = graph.add_edge("knows", alice, bob)
 
         assert edge.other_vertex(alice) == bob
@@ -218,11 +268,9 @@ class TestEdge:
         with pytest.raises(TinkerGraphValidationError):
             edge.other_vertex(charlie)
 
-    def test_edge_string_representations(self):
+    def test_edge_string_representations(self, alice_bob_graph):
         """Test edge string representations."""
-        graph = TinkerGraph()
-        alice = graph.add_vertex("person", vertex_id="alice", name="Alice")
-        bob = graph.add_vertex("person", vertex_id="bob", name="Bob")
+        graph, alice, bob = alice_bob_graph
         edge = graph.add_edge("knows", alice, bob, since=2018)
 
         str_repr = str(edge)
@@ -235,12 +283,9 @@ class TestEdge:
 class TestGraphTraversal:
     """Test graph traversal operations."""
 
-    def test_vertex_edges(self):
+    def test_vertex_edges(self, alice_bob_charlie_graph):
         """Test vertex edge traversal methods."""
-        graph = TinkerGraph()
-        alice = graph.add_vertex("person", name="Alice")
-        bob = graph.add_vertex("person", name="Bob")
-        charlie = graph.add_vertex("person", name="Charlie")
+        graph, alice, bob, charlie = alice_bob_charlie_graph
 
         knows_edge = graph.add_edge("knows", alice, bob)
         works_with_edge = graph.add_edge("works_with", alice, charlie)
@@ -266,12 +311,9 @@ class TestGraphTraversal:
         assert len(knows_edges) == 1
         assert knows_edges[0] == knows_edge
 
-    def test_vertex_vertices(self):
+    def test_vertex_vertices(self, alice_bob_charlie_graph):
         """Test vertex-to-vertex traversal methods."""
-        graph = TinkerGraph()
-        alice = graph.add_vertex("person", name="Alice")
-        bob = graph.add_vertex("person", name="Bob")
-        charlie = graph.add_vertex("person", name="Charlie")
+        graph, alice, bob, charlie = alice_bob_charlie_graph
 
         graph.add_edge("knows", alice, bob)
         graph.add_edge("works_with", alice, charlie)
@@ -293,12 +335,36 @@ class TestGraphTraversal:
         assert len(both_vertices) == 3  # Bob appears twice
 
 
+    def test_traversal_result_view(self, alice_bob_charlie_graph):
+        """Test the read-only sequence returned by traversal methods."""
+        graph, alice, bob, charlie = alice_bob_charlie_graph
+        graph.add_edge("knows", alice, bob)
+        graph.add_edge("knows", alice, charlie)
+
+        neighbors = alice.out_vertices()
+        assert len(neighbors) == 2
+        assert neighbors[0] is bob
+        assert neighbors[-1] is charlie
+        assert neighbors[:1] == [bob]
+        assert list(neighbors) == [bob, charlie]
+        assert neighbors == [bob, charlie]
+        assert neighbors == alice.out_vertices()
+        assert bob in neighbors and charlie in neighbors
+        assert alice not in neighbors
+        assert [] not in neighbors  # Unhashable items are simply not members
+        assert neighbors + [alice] == [bob, charlie, alice]
+
+        with pytest.raises(AttributeError):
+            neighbors.append(alice)
+        with pytest.raises(TypeError):
+            hash(neighbors)
+
+
 class TestGraphQueries:
     """Test graph querying operations."""
 
-    def test_get_vertices(self):
+    def test_get_vertices(self, graph):
         """Test getting vertices with and without filters."""
-        graph = TinkerGraph()
         alice = graph.add_vertex("person", name="Alice", age=30)
         bob = graph.add_vertex("person", name="Bob", age=25)
         company = graph.add_vertex("organization", name="TechCorp")
@@ -316,9 +382,8 @@ class TestGraphQueries:
         assert len(people) == 1
         assert bob in people
 
-    def test_get_edges(self):
+    def test_get_edges(self, graph):
         """Test getting edges with and without filters."""
-        graph = TinkerGraph()
         alice = graph.add_vertex("person", name="Alice")
         bob = graph.add_vertex("person", name="Bob")
         charlie = graph.add_vertex("person", name="Charlie")
@@ -335,9 +400,52 @@ class TestGraphQueries:
         assert len(recent_edges) == 1
         assert knows_edge in recent_edges
 
-    def test_get_vertex_by_id(self):
+    def test_filtered_queries_keep_insertion_order(self, graph):
+        """Test that filtered results come back in the order elements were added."""
+        people = [graph.add_vertex("person", vertex_id=f"p{i}", group=i % 2, tags=["x"])
+                  for i in range(50)]
+        evens = people[::2]
+
+        assert graph.vertices(group=0) == evens
+        # Unhashable filter values take the column scan path
+        assert graph.vertices(group=0, tags=["x"]) == evens
+
+        # A property set after creation lands at the end of its column; each
+        # change also invalidates the cached results checked above
+        people[0].remove_property("group")
+        assert graph.vertices(group=0) == evens[1:]
+        people[0].set_property("group", 0)
+        assert graph.vertices(group=0) == evens
+        assert graph.vertices(group=0, tags=["x"]) == evens
+
+        edges = [graph.add_edge("knows", people[i], people[i + 1]) for i in range(10)]
+        for edge in reversed(edges):
+            edge.set_property("weight", 1)
+        assert graph.edges(weight=1) == edges
+
+    def test_filtered_queries_see_mutations(self, graph):
+        """Test that repeated filtered queries reflect changes in between."""
+        alice = graph.add_vertex("person", name="Alice", age=30)
+        bob = graph.add_vertex("person", name="Bob", age=25)
+        edge = graph.add_edge("knows", alice, bob, since=2018)
+
+        first = graph.vertices(age=30)
+        assert first == [alice]
+        first.append(bob)  # Callers get their own list
+        assert graph.vertices(age=30) == [alice]
+
+        bob.set_property("age", 30)
+        assert set(graph.vertices(age=30)) == {alice, bob}
+
+        assert graph.edges(since=2018) == [edge]
+        edge.set_property("since", 2019)
+        assert graph.edges(since=2018) == []
+
+        graph.remove_vertex(alice)
+        assert graph.vertices(age=30) == [bob]
+
+    def test_get_vertex_by_id(self, graph):
         """Test getting vertex by ID."""
-        graph = TinkerGraph()
         alice = graph.add_vertex("person", vertex_id="alice", name="Alice")
 
         found_vertex = graph.get_vertex("alice")
@@ -346,13 +454,26 @@ class TestGraphQueries:
         not_found = graph.get_vertex("nonexistent")
         assert not_found is None
 
+    def test_get_vertex_by_integer_id(self, graph):
+        """Test looking up auto-generated IDs by the integer the native graph assigned."""
+        first = graph.add_vertex("person")
+        second = graph.add_vertex("person")
+        explicit = graph.add_vertex("person", vertex_id="7")
+
+        assert graph.get_vertex(int(first.id)) is first
+        assert graph.get_vertex(int(second.id)) is second
+        assert graph.get_vertex(second.id) is second
+        assert graph.get_vertex(7) is explicit
+        assert graph.get_vertex(10**6) is None
+        assert graph.get_vertex(["7"]) is None
+        assert graph.get_vertex(None) is None
+
 
 class TestGraphModification:
     """Test graph modification operations."""
 
-    def test_remove_vertex(self):
+    def test_remove_vertex(self, graph):
         """Test vertex removal."""
-        graph = TinkerGraph()
         alice = graph.add_vertex("person", name="Alice")
         bob = graph.add_vertex("person", name="Bob")
         edge = graph.add_edge("knows", alice, bob)
@@ -365,9 +486,30 @@ class TestGraphModification:
         assert graph.vertex_count == 1
         assert graph.edge_count == 0  # Connected edges should be removed
 
-    def test_remove_edge(self):
+    def test_remove_hub_vertex_updates_neighbors(self, alice_bob_charlie_graph):
+        """Test that removing a well-connected vertex leaves neighbors' adjacency intact."""
+        graph, alice, bob, charlie = alice_bob_charlie_graph
+        hub = graph.add_vertex("hub")
+        keep_out = graph.add_edge("knows", alice, bob)
+        keep_in = graph.add_edge("likes", charlie, alice)
+        for _ in range(2):  # Parallel edges in both directions
+            graph.add_edge("knows", hub, alice)
+            graph.add_edge("likes", bob, hub)
+        graph.add_edge("self", hub, hub)
+        alice.out_edges()  # Build adjacency before removing
+
+        graph.remove_vertex(hub)
+
+        assert graph.edge_count == 2
+        assert list(alice.out_edges()) == [keep_out]
+        assert list(alice.in_edges()) == [keep_in]
+        assert list(alice.in_edges("knows")) == []
+        assert list(bob.out_edges("likes")) == []
+        assert list(bob.in_vertices()) == [alice]
+        assert list(charlie.out_vertices("likes")) == [alice]
+
+    def test_remove_edge(self, graph):
         """Test edge removal."""
-        graph = TinkerGraph()
         alice = graph.add_vertex("person", name="Alice")
         bob = graph.add_vertex("person", name="Bob")
         edge = graph.add_edge("knows", alice, bob)
@@ -379,9 +521,8 @@ class TestGraphModification:
         assert graph.edge_count == 0
         assert graph.vertex_count == 2  # Vertices should remain
 
-    def test_clear_graph(self):
+    def test_clear_graph(self, graph):
         """Test clearing the entire graph."""
-        graph = TinkerGraph()
         alice = graph.add_vertex("person", name="Alice")
         bob = graph.add_vertex("person", name="Bob")
         graph.add_edge("knows", alice, bob)
@@ -395,12 +536,152 @@ class TestGraphModification:
         assert graph.edge_count == 0
 
 
+class TestBulkOperations:
+    """Test batched vertex and edge creation."""
+
+    def test_add_vertices_bulk(self, graph):
+        """Test adding a batch of vertices with mixed labels, IDs and properties."""
+        vertices = graph.add_vertices_bulk(
+            ["person", None, "software"],
+            ["alice", None, "lop"],
+            [{"name": "Alice"}, {}, {"lang": "java"}],
+        )
+
+        assert graph.vertex_count == 3
+        alice, anonymous, lop = vertices
+        assert (alice.id, alice.label) == ("alice", "person")
+        assert alice.get_property("name") == "Alice"
+        assert anonymous.label == "vertex"
+        assert anonymous.id
+        assert graph.get_vertex(anonymous.id) is anonymous
+        assert lop.get_property("lang") == "java"
+        assert graph.vertices(lang="java") == [lop]
+
+    def test_add_edges_bulk(self, alice_bob_charlie_graph):
+        """Test adding a batch of edges."""
+        graph, alice, bob, charlie = alice_bob_charlie_graph
+        knows, likes = graph.add_edges_bulk(
+            ["knows", "likes"], [alice, bob], [bob, charlie], [{"since": 2018}, {}]
+        )
+
+        assert graph.edge_count == 2
+        assert (knows.label, knows.out_vertex, knows.in_vertex) == ("knows", alice, bob)
+        assert knows.get_property("since") == 2018
+        assert likes.properties == {}
+        assert list(alice.out_vertices()) == [bob]
+        assert list(charlie.in_edges("likes")) == [likes]
+
+    def test_bulk_validation_errors(self, alice_bob_graph):
+        """Test that malformed batches are rejected before reaching the native side."""
+        graph, alice, bob = alice_bob_graph
+
+        with pytest.raises(TinkerGraphValidationError):
+            graph.add_vertices_bulk(["person", "person"], ["x"])
+        with pytest.raises(TinkerGraphValidationError):
+            graph.add_vertices_bulk([123])
+        with pytest.raises(TinkerGraphValidationError):
+            graph.add_vertices_bulk(["person"], [42])
+        with pytest.raises(TinkerGraphValidationError):
+            graph.add_vertices_bulk(["person"], properties=[None])
+        with pytest.raises(TinkerGraphValidationError):
+            graph.add_vertices_bulk(["person"], properties=[{1: 2}])
+
+        with pytest.raises(TinkerGraphValidationError):
+            graph.add_edges_bulk(["knows"], [alice, bob], [bob])
+        with pytest.raises(TinkerGraphValidationError):
+            graph.add_edges_bulk([None], [alice], [bob])
+        with pytest.raises(TinkerGraphValidationError):
+            graph.add_edges_bulk(["knows"], ["alice"], [bob])
+        with pytest.raises(TinkerGraphValidationError):
+            graph.add_edges_bulk(["knows"], [alice], [bob], [None])
+        with pytest.raises(TinkerGraphValidationError):
+            graph.add_edges_bulk(["knows"], [alice], [bob], [{1: 2}])
+
+        with TinkerGraph() as other:
+            stranger = other.add_vertex("person")
+            with pytest.raises(TinkerGraphValidationError):
+                graph.add_edges_bulk(["knows"], [alice], [stranger])
+
+        assert graph.vertex_count == 2
+        assert graph.edge_count == 0
+
+    def test_bulk_without_native_bulk_functions(self, graph):
+        """Test the per-row fallback used with libraries that lack the bulk entry points."""
+        native = graph._native
+        native._fn_add_vertices_bulk = None
+        native._fn_add_edges_bulk = None
+        native._fn_vertex_ids_bulk = None
+
+        alice, anonymous = graph.add_vertices_bulk(["person", None], ["alice", None],
+                                                   [{"name": "Alice"}, {}])
+        edge, = graph.add_edges_bulk(["knows"], [alice], [anonymous], [{"since": 2018}])
+
+        assert graph.vertex_count == 2
+        assert alice.get_property("name") == "Alice"
+        assert graph.get_vertex(anonymous.id) is anonymous
+        assert edge.get_property("since") == 2018
+        assert list(alice.out_vertices()) == [anonymous]
+
+    def test_bulk_fallback_failure_releases_rows(self, alice_bob_graph, monkeypatch):
+        """Test that the per-row fallback releases the rows it created when a later row fails."""
+        graph, alice, bob = alice_bob_graph
+        native = graph._native
+        native._fn_add_vertices_bulk = None
+        native._fn_add_edges_bulk = None
+        destroyed = []
+        monkeypatch.setattr(native, "destroy_vertex", destroyed.append)
+        monkeypatch.setattr(native, "destroy_edge", destroyed.append)
+
+        def fail_on(name, row):
+            original = getattr(native, name)
+            calls = []
+
+            def add(*args):
+                calls.append(args)
+                if len(calls) == row:
+                    raise TinkerGraphNativeError("row failed")
+                return original(*args)
+            monkeypatch.setattr(native, name, add)
+
+        fail_on("add_vertex_with_properties", 3)
+        with pytest.raises(TinkerGraphVertexError):
+            graph.add_vertices_bulk(["person"] * 3)
+        assert len(destroyed) == 2
+
+        destroyed.clear()
+        fail_on("add_edge_with_properties", 2)
+        with pytest.raises(TinkerGraphEdgeError):
+            graph.add_edges_bulk(["knows", "knows"], [alice, bob], [bob, alice])
+        assert len(destroyed) == 1
+
+        assert graph.vertex_count == 2
+        assert graph.edge_count == 0
+
+
 class TestGraphLifecycle:
     """Test graph lifecycle management."""
 
-    def test_graph_close(self):
+    def test_elements_release_graph(self, native_lib):
+        """Test that removed elements and closed graphs drop their graph references."""
+        with TinkerGraph() as graph:
+            alice = graph.add_vertex("person", name="Alice")
+            bob = graph.add_vertex("person", name="Bob")
+            edge = graph.add_edge("knows", alice, bob)
+
+            graph.remove_vertex(alice)
+            assert alice._graph() is None
+            assert edge._graph() is None
+            assert bob._graph() is graph
+
+        assert bob._graph() is None
+
+        # With the references broken, refcounting alone frees the closed graph
+        graph_ref = weakref.ref(graph)
+        del graph
+        assert graph_ref() is None
+
+    def test_graph_close(self, graph):
         """Test explicit graph closure."""
-        graph = TinkerGraph()
         alice = graph.add_vertex("person", name="Alice")
 
         assert graph.vertex_count == 1
@@ -413,9 +694,8 @@ class TestGraphLifecycle:
         with pytest.raises(TinkerGraphError):
             _ = graph.vertex_count
 
-    def test_graph_closed_operations(self):
+    def test_graph_closed_operations(self, graph):
         """Test that operations fail on closed graph."""
-        graph = TinkerGraph()
         alice = graph.add_vertex("person", name="Alice")
         graph.close()
 
@@ -429,41 +709,93 @@ class TestGraphLifecycle:
             graph.vertices()
 
 
+class TestNativeHandle:
+    """Test the low-level NativeGraphHandle wrapper."""
+
+    def test_property_buffers_are_per_thread(self, native_lib):
+        """Test that concurrent callers never share property key/value arrays."""
+        handle = NativeGraphHandle()
+        arrays = {}
+
+        def fill(name):
+            key_array, value_array, _ = handle._property_buffers({"name": name})
+            arrays[name] = (key_array, value_array)
+
+        threads = [threading.Thread(target=fill, args=(name,)) for name in ("a", "b")]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+
+        assert arrays["a"][0] is not arrays["b"][0]
+        assert arrays["a"][1] is not arrays["b"][1]
+        assert arrays["a"][1][0] == b"a"
+        assert arrays["b"][1][0] == b"b"
+
+    def test_bytes_property_values(self):
+        """Test that text bytes are sent raw and binary bytes fall back to str()."""
+        assert _encode_value(b"Al\xc3\xafce") == b"Al\xc3\xafce"
+        assert _encode_value(bytearray(b"x")) == b"x"
+        assert _encode_value(memoryview(b"abc")) == b"abc"
+        for value in (b"a\x00b", bytearray(b"\xff\xfe"), b"\xff"):
+            assert _encode_value(value) == str(value).encode("utf-8")
+
+    def test_binary_blob_properties(self, graph):
+        """Test storing binary blobs and reading them back unchanged."""
+        blob = b"\x89PNG\x00\x01"
+        vertex = graph.add_vertex("image", blob=blob, raw=b"\xff")
+        assert vertex.get_property("blob") == blob
+        assert vertex.get_property("raw") == b"\xff"
+
+        bulk, = graph.add_vertices_bulk(["image"], properties=[{"blob": blob}])
+        assert bulk.get_property("blob") == blob
+        edge = graph.add_edge("copy_of", bulk, vertex, blob=bytearray(blob))
+        assert edge.get_property("blob") == bytearray(blob)
+        assert graph.vertices(blob=blob) == [vertex, bulk]
+
+
+@pytest.mark.benchmark
 class TestPerformance:
-    """Performance and stress tests."""
+    """Performance and stress tests (run with --bench)."""
 
-    def test_large_graph_creation(self):
+    @pytest.mark.parametrize(
+        "vertex_count", [100, 1000, LARGE_GRAPH_SIZE], ids=lambda n: f"n={n}"
+    )
+    def test_large_graph_creation(self, graph, vertex_count, record_property):
         """Test creating a graph with many vertices and edges."""
-        graph = TinkerGraph()
-        vertex_count = 1000
-
         # Add vertices
-        start_time = time.time()
-        vertices = []
-        for i in range(vertex_count):
-            vertex = graph.add_vertex("person", vertex_id=f"user{i}", index=i)
-            vertices.append(vertex)
-        vertex_time = time.time() - start_time
+        start_time = time.perf_counter()
+        vertices = graph.add_vertices_bulk(
+            ["person"] * vertex_count,
+            [f"user{i}" for i in range(vertex_count)],
+            [{"index": i} for i in range(vertex_count)],
+        )
+        vertex_time = time.perf_counter() - start_time
 
         assert graph.vertex_count == vertex_count
+        assert vertices[42].id == "user42"
+        assert vertices[42].get_property("index") == 42
 
         # Add edges (create a ring)
-        start_time = time.time()
-        for i in range(vertex_count):
-            next_i = (i + 1) % vertex_count
-            graph.add_edge("connects", vertices[i], vertices[next_i], weight=i)
-        edge_time = time.time() - start_time
+        start_time = time.perf_counter()
+        graph.add_edges_bulk(
+            ["connects"] * vertex_count,
+            vertices,
+            vertices[1:] + vertices[:1],
+            [{"weight": i} for i in range(vertex_count)],
+        )
+        edge_time = time.perf_counter() - start_time
 
         assert graph.edge_count == vertex_count
 
-        # Performance logging
-        print(f"\nPerformance metrics:")
-        print(f"Added {vertex_count} vertices in {vertex_time:.3f}s ({vertex_count/vertex_time:.1f} vertices/sec)")
-        print(f"Added {vertex_count} edges in {edge_time:.3f}s ({vertex_count/edge_time:.1f} edges/sec)")
+        # Timings go to the test report (e.g. --junitxml) rather than stdout
+        record_property("vertex_seconds", vertex_time)
+        record_property("edge_seconds", edge_time)
+        assert vertex_time < vertex_count * MAX_SECONDS_PER_ELEMENT
+        assert edge_time < vertex_count * MAX_SECONDS_PER_ELEMENT
 
-    def test_graph_traversal_performance(self):
+    def test_graph_traversal_performance(self, graph, record_property):
         """Test performance of graph traversal operations."""
-        graph = TinkerGraph()
 
         # Create a star topology (one central vertex connected to many others)
         central = graph.add_vertex("hub", name="Central")
@@ -475,13 +807,14 @@ class TestPerformance:
             graph.add_edge("connects", central, satellite)
 
         # Test traversal performance
-        start_time = time.time()
+        start_time = time.perf_counter()
         for _ in range(100):
             out_vertices = central.out_vertices()
             assert len(out_vertices) == 100
-        traversal_time = time.time() - start_time
+        traversal_time = time.perf_counter() - start_time
 
-        print(f"100 traversals of 100-edge vertex: {traversal_time:.3f}s ({100/traversal_time:.1f} traversals/sec)")
+        record_property("traversal_seconds", traversal_time)
+        assert traversal_time < 100 * MAX_SECONDS_PER_TRAVERSAL
 
 
 class TestErrorHandling:
@@ -498,17 +831,32 @@ class TestErrorHandling:
         with pytest.raises(TinkerGraphValidationError):
             graph1.add_edge("knows", alice, bob)
 
-    def test_property_validation(self):
+    def test_property_validation(self, graph):
         """Test property validation."""
-        graph = TinkerGraph()
         vertex = graph.add_vertex("person", name="Alice")
 
         with pytest.raises(TinkerGraphValidationError):
             vertex.set_property(123, "value")  # Invalid property key type
 
-    def test_memory_cleanup(self):
+    def test_bulk_id_readback_failure(self, graph, monkeypatch):
+        """Test that a failed ID read-back releases the batch and raises a vertex error."""
+        destroyed = []
+
+        def fail(ptrs):
+            raise TinkerGraphNativeError("id read failed")
+
+        monkeypatch.setattr(graph._native, "get_vertex_ids", fail)
+        monkeypatch.setattr(graph._native, "destroy_vertex", destroyed.append)
+
+        with pytest.raises(TinkerGraphVertexError):
+            graph.add_vertices_bulk(["person", "person"], [None, "bob"])
+
+        assert len(destroyed) == 2
+        assert graph.vertex_count == 0
+        assert graph.get_vertex("bob") is None
+
+    def test_memory_cleanup(self, graph):
         """Test that resources are cleaned up properly."""
-        graph = TinkerGraph()
 
         # Create many vertices and edges
         vertices = []
@@ -525,10 +873,3 @@ class TestErrorHandling:
         # Graph should be marked as closed
         with pytest.raises(TinkerGraphError):
             graph.vertex_count
-
-
-if __name__ == "__main__":
-    # Run a simple test if executed directly
-    test = TestTinkerGraph()
-    test.test_create_graph()
-    print("Basic test passed!")
@@ -9,6 +9,7 @@ and basic memory management for interfacing with the native code.
 import ctypes
 import os
 import sys
+import threading
 from pathlib import Path
 from typing import Optional, List
 
@@ -20,12 +21,195 @@ from .exceptions import (
 )
 
 
+# Labels and property keys come from a small, heavily reused vocabulary, so
+# their UTF-8 encodings are cached; the cap bounds growth from unique strings.
+_UTF8_CACHE_MAX = 4096
+_utf8_cache = {}
+
+
+def _u8(text: str) -> bytes:
+    """Encode a label or property key to UTF-8, reusing cached encodings."""
+    encoded = _utf8_cache.get(text)
+    if encoded is None:
+        encoded = text.encode('utf-8')
+        if len(_utf8_cache) < _UTF8_CACHE_MAX:
+            _utf8_cache[text] = encoded
+    return encoded
+
+
+def _encode_value(value) -> bytes:
+    """
+    Encode a property value for the native side.
+
+    The native side reads a NUL-terminated UTF-8 string. Bytes-like values
+    that already are one are sent as their raw bytes: a bytes object is
+    passed as is (c_char_p points at its buffer), while bytearray and
+    memoryview values are copied once into bytes, since c_char_p only accepts
+    bytes. Any others (binary data with NULs or invalid UTF-8) fall back to
+    their str() form, like every other non-string value.
+    """
+    if isinstance(value, str):
+        return value.encode('utf-8')
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        data = value if isinstance(value, bytes) else bytes(value)
+        if _is_native_text(data):
+            return data
+    return str(value).encode('utf-8')
+
+
+def _is_native_text(data: bytes) -> bool:
+    """
+    Check that bytes contain no NUL and are valid UTF-8.
+
+    The NUL scan is a memchr and ASCII data needs no decode, so this reads the
+    value at most twice, and only non-ASCII values pay for a decode. That is
+    still cheaper than the str() fallback, which escapes every non-ASCII byte
+    into a four-character sequence and then encodes the result.
+    """
+    if b'\0' in data:
+        return False
+    if data.isascii():
+        return True
+    try:
+        data.decode('utf-8')
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+# Per-thread scratch buffers. CDLL calls release the GIL, so a buffer shared
+# between threads could be overwritten while the native side is reading it.
+_tls = threading.local()
+
+
+def _string_buffer(size: int):
+    """Return this thread's scratch buffer, grown to at least size bytes."""
+    buffer = getattr(_tls, 'buffer', None)
+    if buffer is None or len(buffer) < size:
+        buffer = ctypes.create_string_buffer(size)
+        _tls.buffer = buffer
+    return buffer
+
+
+def _property_arrays(count: int):
+    """Return this thread's property key/value arrays, grown to at least count slots."""
+    arrays = getattr(_tls, 'property_arrays', None)
+    if arrays is None or len(arrays[0]) < count:
+        size = max(count, 2 * len(arrays[0]) if arrays else 0, 8)
+        arrays = ((ctypes.c_char_p * size)(), (ctypes.c_char_p * size)())
+        _tls.property_arrays = arrays
+    return arrays
+
+
+_c_char_pp = ctypes.POINTER(ctypes.c_char_p)
+_c_void_pp = ctypes.POINTER(ctypes.c_void_p)
+_c_int_p = ctypes.POINTER(ctypes.c_int)
+
+# Native function signatures as (restype, argtypes), built once at import
+_SIGNATURES = {
+    # Graph management functions
+    'tinkergraph_create': (ctypes.c_void_p, ()),
+    'tinkergraph_destroy': (None, (ctypes.c_void_p,)),
+
+    # Vertex operations
+    'tinkergraph_add_vertex': (ctypes.c_void_p, (ctypes.c_void_p, ctypes.c_char_p)),
+    'tinkergraph_add_vertex_with_properties': (ctypes.c_void_p, (
+        ctypes.c_void_p,  # graph
+        ctypes.c_char_p,  # id
+        _c_char_pp,       # property keys
+        _c_char_pp,       # property values
+        ctypes.c_int,     # property count
+    )),
+
+    # Edge operations
+    'tinkergraph_add_edge': (ctypes.c_void_p, (
+        ctypes.c_void_p,  # graph
+        ctypes.c_char_p,  # label
+        ctypes.c_void_p,  # out vertex
+        ctypes.c_void_p,  # in vertex
+    )),
+    'tinkergraph_add_edge_with_properties': (ctypes.c_void_p, (
+        ctypes.c_void_p,  # graph
+        ctypes.c_char_p,  # label
+        ctypes.c_void_p,  # out vertex
+        ctypes.c_void_p,  # in vertex
+        _c_char_pp,       # property keys
+        _c_char_pp,       # property values
+        ctypes.c_int,     # property count
+    )),
+
+    # Element property access functions
+    'tinkergraph_vertex_id': (ctypes.c_int, (
+        ctypes.c_void_p,  # vertex
+        ctypes.c_char_p,  # buffer
+        ctypes.c_int,     # buffer size
+    )),
+    'tinkergraph_edge_label': (ctypes.c_int, (
+        ctypes.c_void_p,  # edge
+        ctypes.c_char_p,  # buffer
+        ctypes.c_int,     # buffer size
+    )),
+
+    # Element cleanup functions
+    'tinkergraph_destroy_vertex': (None, (ctypes.c_void_p,)),
+    'tinkergraph_destroy_edge': (None, (ctypes.c_void_p,)),
+
+    # Error handling function
+    'tinkergraph_get_error_message': (ctypes.c_int, (
+        ctypes.c_char_p,  # buffer
+        ctypes.c_int,     # buffer size
+    )),
+}
+
+_PACKED_STRINGS_ARGTYPES = (
+    _c_void_pp,       # elements
+    ctypes.c_int,     # element count
+    ctypes.c_char_p,  # buffer
+    ctypes.c_int,     # buffer size
+    _c_int_p,         # row offsets (count + 1)
+)
+
+# Entry points that older library builds do not export
+_OPTIONAL_SIGNATURES = {
+    'tinkergraph_add_vertices_bulk': (ctypes.c_int, (
+        ctypes.c_void_p,  # graph
+        _c_char_pp,       # ids
+        _c_char_pp,       # flattened property keys
+        _c_char_pp,       # flattened property values
+        _c_int_p,         # property count per row
+        ctypes.c_int,     # row count
+        _c_void_pp,       # created vertices (out)
+    )),
+    'tinkergraph_add_edges_bulk': (ctypes.c_int, (
+        ctypes.c_void_p,  # graph
+        _c_char_pp,       # labels
+        _c_void_pp,       # out vertices
+        _c_void_pp,       # in vertices
+        _c_char_pp,       # flattened property keys
+        _c_char_pp,       # flattened property values
+        _c_int_p,         # property count per row
+        ctypes.c_int,     # row count
+        _c_void_pp,       # created edges (out)
+    )),
+    # Bulk reads into one packed UTF-8 buffer plus row offsets
+    'tinkergraph_vertex_ids_bulk': (ctypes.c_int, _PACKED_STRINGS_ARGTYPES),
+    'tinkergraph_edge_labels_bulk': (ctypes.c_int, _PACKED_STRINGS_ARGTYPES),
+}
+
+# Query functions, called with the GIL held
+_GIL_HELD_SIGNATURES = {
+    'tinkergraph_vertex_count': (ctypes.c_long, (ctypes.c_void_p,)),
+    'tinkergraph_edge_count': (ctypes.c_long, (ctypes.c_void_p,)),
+}
+
+
 class TinkerGraphNativeLibrary:
     """Wrapper for the native TinkerGraph shared library."""
 
     def __init__(self):
         """Initialize the native library wrapper."""
         self._lib = None
+        self._pylib = None
         self._load_library()
         self._configure_functions()
 
@@ -39,7 +223,8 @@ class TinkerGraphNativeLibrary:
         Raises:
             TinkerGraphLibraryError: If the library cannot be found
         """
-        current_dir = Path(__file__).parent
+        env_value = os.environ.get('TINKERGRAPH_NATIVE_LIB')
+        current_dir = os.path.dirname(__file__)
 
         # Determine the shared library extension based on platform
         if sys.platform.startswith('linux'):
@@ -53,149 +238,119 @@ class TinkerGraphNativeLibrary:
 
         lib_filename = f"libtinkergraphs.{lib_extension}"
 
-        # Search locations for the native library
+        # Search locations for the native library, kept as plain strings so the
+        # probe below is a bare os.stat per candidate
         candidates = [
             # Relative to the Python package (development/build)
-            current_dir / f"../../build/bin/native/releaseShared/{lib_filename}",
-            current_dir / f"../../build/bin/native/debugShared/{lib_filename}",
+            os.path.join(current_dir, f"../../build/bin/native/releaseShared/{lib_filename}"),
+            os.path.join(current_dir, f"../../build/bin/native/debugShared/{lib_filename}"),
             # Relative to the Python package (installed)
-            current_dir / lib_filename,
+            os.path.join(current_dir, lib_filename),
             # System-wide installation paths
-            Path(f"/usr/local/lib/{lib_filename}"),
-            Path(f"/usr/lib/{lib_filename}"),
+            f"/usr/local/lib/{lib_filename}",
+            f"/usr/lib/{lib_filename}",
             # Windows paths
-            Path(f"C:/Program Files/TinkerGraphs/{lib_filename}"),
+            f"C:/Program Files/TinkerGraphs/{lib_filename}",
             # macOS paths
-            Path(f"/usr/local/lib/{lib_filename}"),
-            Path(f"/opt/homebrew/lib/{lib_filename}"),
+            f"/usr/local/lib/{lib_filename}",
+            f"/opt/homebrew/lib/{lib_filename}",
         ]
 
         # Also check environment variable
-        if 'TINKERGRAPH_NATIVE_LIB' in os.environ:
-            env_path = Path(os.environ['TINKERGRAPH_NATIVE_LIB'])
-            candidates.insert(0, env_path)
+        if env_value is not None:
+            candidates.insert(0, env_value)
 
         for candidate in candidates:
-            if candidate.exists():
-                return candidate.resolve()
+            if os.path.exists(candidate):
+                return Path(os.path.realpath(candidate))
 
         raise_library_error(
             "native library",
-            f"Could not find {lib_filename}. Tried: {[str(c) for c in candidates]}"
+            f"Could not find {lib_filename}. Tried: {candidates}"
         )
 
     def _load_library(self):
         """Load the native shared library."""
         try:
             lib_path = self._find_native_library()
-            self._lib = ctypes.CDLL(str(lib_path))
+            # Keep the Kotlin/Native runtime symbols private to this library
+            # (ctypes defaults to RTLD_GLOBAL on macOS)
+            self._lib = ctypes.CDLL(str(lib_path), mode=ctypes.RTLD_LOCAL)
+            # Same library handle, but calls keep the GIL held (see _configure_functions)
+            self._pylib = ctypes.PyDLL(str(lib_path), handle=self._lib._handle)
         except Exception as e:
             raise_library_error(str(lib_path) if 'lib_path' in locals() else "unknown", str(e))
 
     def _configure_functions(self):
         """Configure function signatures for all exported functions."""
+        for name, (restype, argtypes) in _SIGNATURES.items():
+            func = getattr(self._lib, name)
+            func.restype = restype
+            func.argtypes = argtypes
 
-        # Graph management functions
-        self._lib.tinkergraph_create.restype = ctypes.c_void_p
-        self._lib.tinkergraph_create.argtypes = []
+        # Bulk operations (absent from libraries built before they were added)
+        for name, (restype, argtypes) in _OPTIONAL_SIGNATURES.items():
+            if hasattr(self._lib, name):
+                func = getattr(self._lib, name)
+                func.restype = restype
+                func.argtypes = argtypes
 
-        self._lib.tinkergraph_destroy.restype = None
-        self._lib.tinkergraph_destroy.argtypes = [ctypes.c_void_p]
+        # CDLL calls release the GIL, which suits the add and bulk calls; the
+        # counts are too short for that to pay off, so they are called through
+        # the PyDLL view and keep the GIL held.
+        for name, (restype, argtypes) in _GIL_HELD_SIGNATURES.items():
+            func = getattr(self._pylib, name)
+            func.restype = restype
+            func.argtypes = argtypes
 
-        # Vertex operations
-        self._lib.tinkergraph_add_vertex.restype = ctypes.c_void_p
-        self._lib.tinkergraph_add_vertex.argtypes = [ctypes.c_void_p, ctypes.c_char_p]
 
-        self._lib.tinkergraph_add_vertex_with_properties.restype = ctypes.c_void_p
-        self._lib.tinkergraph_add_vertex_with_properties.argtypes = [
-            ctypes.c_void_p,  # graph
-            ctypes.c_char_p,  # id
-            ctypes.POINTER(ctypes.c_char_p),  # property keys
-            ctypes.POINTER(ctypes.c_char_p),  # property values
-            ctypes.c_int,  # property count
-        ]
-
-        # Edge operations
-        self._lib.tinkergraph_add_edge.restype = ctypes.c_void_p
-        self._lib.tinkergraph_add_edge.argtypes = [
-            ctypes.c_void_p,  # graph
-            ctypes.c_char_p,  # label
-            ctypes.c_void_p,  # out vertex
-            ctypes.c_void_p,  # in vertex
-        ]
-
-        self._lib.tinkergraph_add_edge_with_properties.restype = ctypes.c_void_p
-        self._lib.tinkergraph_add_edge_with_properties.argtypes = [
-            ctypes.c_void_p,  # graph
-            ctypes.c_char_p,  # label
-            ctypes.c_void_p,  # out vertex
-            ctypes.c_void_p,  # in vertex
-            ctypes.POINTER(ctypes.c_char_p),  # property keys
-            ctypes.POINTER(ctypes.c_char_p),  # property values
-            ctypes.c_int,  # property count
-        ]
+_library: Optional[TinkerGraphNativeLibrary] = None
 
-        # Query functions
-        self._lib.tinkergraph_vertex_count.restype = ctypes.c_long
-        self._lib.tinkergraph_vertex_count.argtypes = [ctypes.c_void_p]
 
-        self._lib.tinkergraph_edge_count.restype = ctypes.c_long
-        self._lib.tinkergraph_edge_count.argtypes = [ctypes.c_void_p]
-
-        # Element property access functions
-        self._lib.tinkergraph_vertex_id.restype = ctypes.c_int
-        self._lib.tinkergraph_vertex_id.argtypes = [
-            ctypes.c_void_p,  # vertex
-            ctypes.c_char_p,  # buffer
-            ctypes.c_int,     # buffer size
-        ]
-
-        self._lib.tinkergraph_edge_label.restype = ctypes.c_int
-        self._lib.tinkergraph_edge_label.argtypes = [
-            ctypes.c_void_p,  # edge
-            ctypes.c_char_p,  # buffer
-            ctypes.c_int,     # buffer size
-        ]
-
-        # Element cleanup functions
-        self._lib.tinkergraph_destroy_vertex.restype = None
-        self._lib.tinkergraph_destroy_vertex.argtypes = [ctypes.c_void_p]
-
-        self._lib.tinkergraph_destroy_edge.restype = None
-        self._lib.tinkergraph_destroy_edge.argtypes = [ctypes.c_void_p]
-
-        # Error handling function
-        self._lib.tinkergraph_get_error_message.restype = ctypes.c_int
-        self._lib.tinkergraph_get_error_message.argtypes = [
-            ctypes.c_char_p,  # buffer
-            ctypes.c_int,     # buffer size
-        ]
+def _get_library() -> TinkerGraphNativeLibrary:
+    """Get the shared library instance, loading it on first use."""
+    global _library
+    if _library is None:
+        _library = TinkerGraphNativeLibrary()
+    return _library
 
 
 class NativeGraphHandle:
     """Handle to a native TinkerGraph instance."""
 
-    _lib_instance = None
-
-    @classmethod
-    def _get_library(cls) -> TinkerGraphNativeLibrary:
-        """Get the shared library instance (singleton)."""
-        if cls._lib_instance is None:
-            cls._lib_instance = TinkerGraphNativeLibrary()
-        return cls._lib_instance
+    _get_library = staticmethod(_get_library)
 
     def __init__(self):
         """Create a new TinkerGraph instance."""
-        self._lib = self._get_library()
-        self._ptr = self._lib._lib.tinkergraph_create()
+        self._lib = _get_library()
+        lib = self._lib._lib
+
+        # Bind the ctypes functions once so per-call paths skip the attribute walk
+        self._fn_destroy = lib.tinkergraph_destroy
+        self._fn_add_vertex = lib.tinkergraph_add_vertex
+        self._fn_add_vertex_with_properties = lib.tinkergraph_add_vertex_with_properties
+        self._fn_add_edge = lib.tinkergraph_add_edge
+        self._fn_add_edge_with_properties = lib.tinkergraph_add_edge_with_properties
+        self._fn_add_vertices_bulk = getattr(lib, 'tinkergraph_add_vertices_bulk', None)
+        self._fn_add_edges_bulk = getattr(lib, 'tinkergraph_add_edges_bulk', None)
+        self._fn_vertex_count = self._lib._pylib.tinkergraph_vertex_count
+        self._fn_edge_count = self._lib._pylib.tinkergraph_edge_count
+        self._fn_vertex_id = lib.tinkergraph_vertex_id
+        self._fn_edge_label = lib.tinkergraph_edge_label
+        self._fn_vertex_ids_bulk = getattr(lib, 'tinkergraph_vertex_ids_bulk', None)
+        self._fn_edge_labels_bulk = getattr(lib, 'tinkergraph_edge_labels_bulk', None)
+        self._fn_destroy_vertex = lib.tinkergraph_destroy_vertex
+        self._fn_destroy_edge = lib.tinkergraph_destroy_edge
+
+        self._ptr = lib.tinkergraph_create()
         if not self._ptr:
             raise_native_error("create_graph", "Native graph creation returned null")
 
     def __del__(self):
         """Clean up the native graph instance."""
-        if hasattr(self, '_ptr') and self._ptr and hasattr(self, '_lib'):
+        if hasattr(self, '_ptr') and self._ptr and hasattr(self, '_fn_destroy'):
             try:
-                self._lib._lib.tinkergraph_destroy(self._ptr)
+                self._fn_destroy(self._ptr)
             except:
                 # Ignore errors during cleanup
                 pass
@@ -214,7 +369,7 @@ class NativeGraphHandle:
             TinkerGraphNativeError: If vertex creation fails
         """
         id_bytes = vertex_id.encode('utf-8') if vertex_id else None
-        vertex_ptr = self._lib._lib.tinkergraph_add_vertex(self._ptr, id_bytes)
+        vertex_ptr = self._fn_add_vertex(self._ptr, id_bytes)
         if not vertex_ptr:
             raise_native_error("add_vertex", f"Failed to add vertex with id '{vertex_id}'")
         return vertex_ptr
@@ -235,20 +390,9 @@ class NativeGraphHandle:
         """
         id_bytes = vertex_id.encode('utf-8') if vertex_id else None
 
-        # Convert properties to C arrays
-        if properties:
-            keys = [k.encode('utf-8') for k in properties.keys()]
-            values = [str(v).encode('utf-8') for v in properties.values()]
-
-            key_array = (ctypes.c_char_p * len(keys))(*keys)
-            value_array = (ctypes.c_char_p * len(values))(*values)
-            count = len(properties)
-        else:
-            key_array = None
-            value_array = None
-            count = 0
+        key_array, value_array, count = self._property_buffers(properties)
 
-        vertex_ptr = self._lib._lib.tinkergraph_add_vertex_with_properties(
+        vertex_ptr = self._fn_add_vertex_with_properties(
             self._ptr, id_bytes, key_array, value_array, count
         )
 
@@ -259,6 +403,24 @@ class NativeGraphHandle:
             )
         return vertex_ptr
 
+    def _property_buffers(self, properties: dict):
+        """
+        Fill this thread's reusable key/value arrays from a property dictionary.
+
+        Returns:
+            Tuple of (key array, value array, property count); the arrays are
+            None when there are no properties
+        """
+        count = len(properties) if properties else 0
+        if not count:
+            return None, None, 0
+
+        key_buf, val_buf = _property_arrays(count)
+        for i, (key, value) in enumerate(properties.items()):
+            key_buf[i] = _u8(key)
+            val_buf[i] = _encode_value(value)
+        return key_buf, val_buf, count
+
     def add_edge(self, label: str, out_vertex_ptr: int, in_vertex_ptr: int) -> int:
         """
         Add an edge to the graph.
@@ -274,8 +436,8 @@ class NativeGraphHandle:
         Raises:
             TinkerGraphNativeError: If edge creation fails
         """
-        label_bytes = label.encode('utf-8')
-        edge_ptr = self._lib._lib.tinkergraph_add_edge(
+        label_bytes = _u8(label)
+        edge_ptr = self._fn_add_edge(
             self._ptr, label_bytes, out_vertex_ptr, in_vertex_ptr
         )
         if not edge_ptr:
@@ -299,22 +461,11 @@ class NativeGraphHandle:
         Raises:
             TinkerGraphNativeError: If edge creation fails
         """
-        label_bytes = label.encode('utf-8')
+        label_bytes = _u8(label)
 
-        # Convert properties to C arrays
-        if properties:
-            keys = [k.encode('utf-8') for k in properties.keys()]
-            values = [str(v).encode('utf-8') for v in properties.values()]
+        key_array, value_array, count = self._property_buffers(properties)
 
-            key_array = (ctypes.c_char_p * len(keys))(*keys)
-            value_array = (ctypes.c_char_p * len(values))(*values)
-            count = len(properties)
-        else:
-            key_array = None
-            value_array = None
-            count = 0
-
-        edge_ptr = self._lib._lib.tinkergraph_add_edge_with_properties(
+        edge_ptr = self._fn_add_edge_with_properties(
             self._ptr, label_bytes, out_vertex_ptr, in_vertex_ptr,
             key_array, value_array, count
         )
@@ -326,13 +477,123 @@ class NativeGraphHandle:
             )
         return edge_ptr
 
+    @staticmethod
+    def _flatten_properties(properties: List[dict]):
+        """Pack per-row property dicts into flat key/value arrays plus per-row counts."""
+        keys = [_u8(k) for row in properties for k in row]
+        values = [_encode_value(v) for row in properties for v in row.values()]
+        counts = [len(row) for row in properties]
+        return (
+            (ctypes.c_char_p * len(keys))(*keys),
+            (ctypes.c_char_p * len(values))(*values),
+            (ctypes.c_int * len(counts))(*counts),
+        )
+
+    def add_vertices_bulk(self, vertex_ids: List[Optional[str]],
+                          properties: Optional[List[dict]] = None) -> List[int]:
+        """
+        Add a batch of vertices to the graph in one native call.
+
+        Args:
+            vertex_ids: Optional vertex ID per row
+            properties: Property dictionary per row (optional)
+
+        Returns:
+            Native pointers to the created vertices, in row order
+
+        Raises:
+            TinkerGraphNativeError: If any vertex in the batch cannot be created
+        """
+        if properties is None:
+            properties = [{}] * len(vertex_ids)
+        bulk = self._fn_add_vertices_bulk
+        if bulk is None:
+            created = []
+            try:
+                for vertex_id, props in zip(vertex_ids, properties):
+                    created.append(self.add_vertex_with_properties(vertex_id, props))
+            except TinkerGraphNativeError:
+                # Release the rows already created, as a failed native batch does
+                for ptr in created:
+                    self.destroy_vertex(ptr)
+                raise
+            return created
+
+        count = len(vertex_ids)
+        ids = [v.encode('utf-8') if v else None for v in vertex_ids]
+        id_array = (ctypes.c_char_p * count)(*ids)
+        key_array, value_array, count_array = self._flatten_properties(properties)
+        out_array = (ctypes.c_void_p * count)()
+
+        created = bulk(self._ptr, id_array, key_array, value_array, count_array,
+                       count, out_array)
+        if created != count:
+            for ptr in out_array[:max(created, 0)]:
+                self.destroy_vertex(ptr)
+            raise_native_error(
+                "add_vertices_bulk",
+                f"Created {max(created, 0)} of {count} vertices"
+            )
+        return list(out_array)
+
+    def add_edges_bulk(self, labels: List[str], out_vertex_ptrs: List[int],
+                       in_vertex_ptrs: List[int],
+                       properties: Optional[List[dict]] = None) -> List[int]:
+        """
+        Add a batch of edges to the graph in one native call.
+
+        Args:
+            labels: Edge label per row
+            out_vertex_ptrs: Native pointer to the source vertex per row
+            in_vertex_ptrs: Native pointer to the target vertex per row
+            properties: Property dictionary per row (optional)
+
+        Returns:
+            Native pointers to the created edges, in row order
+
+        Raises:
+            TinkerGraphNativeError: If any edge in the batch cannot be created
+        """
+        if properties is None:
+            properties = [{}] * len(labels)
+        bulk = self._fn_add_edges_bulk
+        if bulk is None:
+            created = []
+            try:
+                for label, out_ptr, in_ptr, props in zip(
+                        labels, out_vertex_ptrs, in_vertex_ptrs, properties):
+                    created.append(self.add_edge_with_properties(label, out_ptr, in_ptr, props))
+            except TinkerGraphNativeError:
+                for ptr in created:
+                    self.destroy_edge(ptr)
+                raise
+            return created
+
+        count = len(labels)
+        label_array = (ctypes.c_char_p * count)(*[_u8(l) for l in labels])
+        out_vertex_array = (ctypes.c_void_p * count)(*out_vertex_ptrs)
+        in_vertex_array = (ctypes.c_void_p * count)(*in_vertex_ptrs)
+        key_array, value_array, count_array = self._flatten_properties(properties)
+        out_array = (ctypes.c_void_p * count)()
+
+        created = bulk(self._ptr, label_array, out_vertex_array, in_vertex_array,
+                       key_array, value_array, count_array, count, out_array)
+        if created != count:
+            for ptr in out_array[:max(created, 0)]:
+                self.destroy_edge(ptr)
+            raise_native_error(
+                "add_edges_bulk",
+                f"Created {max(created, 0)} of {count} edges"
+            )
+        return list(out_array)
+
     def vertex_count(self) -> int:
         """Get the number of vertices in the graph."""
-        return self._lib._lib.tinkergraph_vertex_count(self._ptr)
+        return self._fn_vertex_count(self._ptr)
 
     def edge_count(self) -> int:
         """Get the number of edges in the graph."""
-        return self._lib._lib.tinkergraph_edge_count(self._ptr)
+        return self._fn_edge_count(self._ptr)
 
     def get_vertex_id(self, vertex_ptr: int, buffer_size: int = 256) -> str:
         """
@@ -345,8 +606,8 @@ class NativeGraphHandle:
         Returns:
             The vertex ID as a string
         """
-        buffer = ctypes.create_string_buffer(buffer_size)
-        result_size = self._lib._lib.tinkergraph_vertex_id(vertex_ptr, buffer, buffer_size)
+        buffer = _string_buffer(buffer_size)
+        result_size = self._fn_vertex_id(vertex_ptr, buffer, buffer_size)
 
         if result_size < 0:
             raise_native_error("get_vertex_id", "Failed to retrieve vertex ID")
@@ -364,23 +625,70 @@ class NativeGraphHandle:
         Returns:
             The edge label as a string
         """
-        buffer = ctypes.create_string_buffer(buffer_size)
-        result_size = self._lib._lib.tinkergraph_edge_label(edge_ptr, buffer, buffer_size)
+        buffer = _string_buffer(buffer_size)
+        result_size = self._fn_edge_label(edge_ptr, buffer, buffer_size)
 
         if result_size < 0:
             raise_native_error("get_edge_label", "Failed to retrieve edge label")
 
         return buffer.value.decode('utf-8') if buffer.value else ""
 
+    def get_vertex_ids(self, vertex_ptrs: List[int]) -> List[str]:
+        """
+        Get the IDs of many vertices with one native call.
+
+        Args:
+            vertex_ptrs: Native pointers to the vertices
+
+        Returns:
+            The vertex IDs, in the same order
+        """
+        if self._fn_vertex_ids_bulk is None:
+            return [self.get_vertex_id(ptr) for ptr in vertex_ptrs]
+        return self._read_strings_bulk(self._fn_vertex_ids_bulk, vertex_ptrs, "get_vertex_ids")
+
+    def get_edge_labels(self, edge_ptrs: List[int]) -> List[str]:
+        """
+        Get the labels of many edges with one native call.
+
+        Args:
+            edge_ptrs: Native pointers to the edges
+
+        Returns:
+            The edge labels, in the same order
+        """
+        if self._fn_edge_labels_bulk is None:
+            return [self.get_edge_label(ptr) for ptr in edge_ptrs]
+        return self._read_strings_bulk(self._fn_edge_labels_bulk, edge_ptrs, "get_edge_labels")
+
+    @staticmethod
+    def _read_strings_bulk(bulk, ptrs: List[int], operation: str) -> List[str]:
+        """Call a packed-string bulk reader, growing the buffer once if the batch does not fit."""
+        count = len(ptrs)
+        ptr_array = (ctypes.c_void_p * count)(*ptrs)
+        offset_array = (ctypes.c_int * (count + 1))()
+
+        buffer = _string_buffer(max(64 * count, 256))
+        total = bulk(ptr_array, count, buffer, len(buffer), offset_array)
+        if total > len(buffer):
+            buffer = _string_buffer(total)
+            total = bulk(ptr_array, count, buffer, len(buffer), offset_array)
+        if total < 0:
+            raise_native_error(operation, f"Failed to read {count} strings")
+
+        blob = ctypes.string_at(buffer, total)
+        offsets = offset_array[:]
+        return [blob[offsets[i]:offsets[i + 1]].decode('utf-8') for i in range(count)]
+
     def destroy_vertex(self, vertex_ptr: int):
         """Destroy a vertex handle (cleanup memory)."""
         if vertex_ptr:
-            self._lib._lib.tinkergraph_destroy_vertex(vertex_ptr)
+            self._fn_destroy_vertex(vertex_ptr)
 
     def destroy_edge(self, edge_ptr: int):
         """Destroy an edge handle (cleanup memory)."""
         if edge_ptr:
-            self._lib._lib.tinkergraph_destroy_edge(edge_ptr)
+            self._fn_destroy_edge(edge_ptr)
 
     def get_last_error(self, buffer_size: int = 512) -> str:
         """
@@ -392,7 +700,7 @@ class NativeGraphHandle:
         Returns:
             The last error message as a string
         """
-        buffer = ctypes.create_string_buffer(buffer_size)
+        buffer = _string_buffer(buffer_size)
         result_size = self._lib._lib.tinkergraph_get_error_message(buffer, buffer_size)
 
         if result_size < 0:
@@ -113,43 +113,34 @@ class TinkerGraphConfigurationError(TinkerGraphError):
 
 def raise_native_error(operation: str, details: str = None) -> None:
     """Raise a TinkerGraphNativeError with a standardized message."""
-    message = f"Native operation '{operation}' failed"
-    if details:
-        message += f": {details}"
-    raise TinkerGraphNativeError(message)
+    suffix = f": {details}" if details else ""
+    raise TinkerGraphNativeError(f"Native operation '{operation}' failed{suffix}")
 
 
 def raise_library_error(library_path: str, details: str = None) -> None:
     """Raise a TinkerGraphLibraryError for library loading issues."""
-    message = f"Failed to load native library at '{library_path}'"
-    if details:
-        message += f": {details}"
-    raise TinkerGraphLibraryError(message)
+    suffix = f": {details}" if details else ""
+    raise TinkerGraphLibraryError(f"Failed to load native library at '{library_path}'{suffix}")
 
 
 def raise_vertex_error(operation: str, vertex_id=None, details: str = None) -> None:
     """Raise a TinkerGraphVertexError with vertex context."""
-    message = f"Vertex operation '{operation}' failed"
-    if vertex_id is not None:
-        message += f" for vertex '{vertex_id}'"
-    if details:
-        message += f": {details}"
-    raise TinkerGraphVertexError(message)
+    target = f" for vertex '{vertex_id}'" if vertex_id is not None else ""
+    suffix = f": {details}" if details else ""
+    raise TinkerGraphVertexError(f"Vertex operation '{operation}' failed{target}{suffix}")
 
 
 def raise_edge_error(operation: str, edge_details: str = None, details: str = None) -> None:
     """Raise a TinkerGraphEdgeError with edge context."""
-    message = f"Edge operation '{operation}' failed"
-    if edge_details:
-        message += f" for edge {edge_details}"
-    if details:
-        message += f": {details}"
-    raise TinkerGraphEdgeError(message)
+    target = f" for edge {edge_details}" if edge_details else ""
+    suffix = f": {details}" if details else ""
+    raise TinkerGraphEdgeError(f"Edge operation '{operation}' failed{target}{suffix}")
 
 
 def raise_validation_error(parameter: str, expected_type: str, actual_value=None) -> None:
     """Raise a TinkerGraphValidationError for parameter validation."""
-    message = f"Invalid parameter '{parameter}': expected {expected_type}"
-    if actual_value is not None:
-        message += f", got {type(actual_value).__name__} '{actual_value}'"
-    raise TinkerGraphValidationError(message)
+    actual = (f", got {type(actual_value).__name__} '{actual_value}'"
+              if actual_value is not None else "")
+    raise TinkerGraphValidationError(
+        f"Invalid parameter '{parameter}': expected {expected_type}{actual}"
+    )
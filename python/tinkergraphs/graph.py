@@ -6,8 +6,13 @@ wrapping the low-level ctypes bindings with high-level Python classes that
 follow Python conventions and best practices.
 """
 
-from typing import Dict, Any, Optional, List, Iterator, Union
-import weakref
+from array import array
+from collections import OrderedDict
+from collections.abc import MutableMapping, Sequence
+from operator import attrgetter
+from typing import Dict, Any, Optional, List, Iterator, Union, Tuple, Set, Hashable
+import itertools
+import sys
 
 from .bindings import NativeGraphHandle
 from .exceptions import (
@@ -20,6 +25,12 @@ from .exceptions import (
     raise_validation_error
 )
 
+# Sentinel for "no value in this property column"
+_MISSING = object()
+
+# Number of filtered vertices()/edges() results kept per graph
+_QUERY_CACHE_SIZE = 64
+
 
 class TinkerGraph:
     """
@@ -43,7 +54,21 @@ class TinkerGraph:
             self._native = NativeGraphHandle()
             self._vertices: Dict[int, 'Vertex'] = {}
             self._edges: Dict[int, 'Edge'] = {}
+            self._id_to_vertex: Dict[str, 'Vertex'] = {}
+            # Per-vertex adjacency arrays are filled on the first traversal
+            self._adjacency_built = False
+            # Property storage by column: key -> {element pointer: value}
+            self._vertex_columns: Dict[str, Dict[int, Any]] = {}
+            self._edge_columns: Dict[str, Dict[int, Any]] = {}
+            # (key, value) -> vertex pointers; built lazily by the first filtered query
+            self._prop_index: Optional[Dict[Tuple[str, Hashable], Set[int]]] = None
+            # Filtered query results, dropped wholesale once _version moves on
+            self._version = 0
+            self._query_cache: 'OrderedDict[tuple, list]' = OrderedDict()
+            self._query_cache_version = 0
             self._vertex_id_counter = 0
+            # Creation sequence numbers, used to return index hits in insertion order
+            self._vertex_seq = itertools.count()
             self._closed = False
         except TinkerGraphNativeError as e:
             raise TinkerGraphError(f"Failed to create TinkerGraph: {e}") from e
@@ -66,17 +91,28 @@ class TinkerGraph:
         Close the graph and cleanup all resources.
 
         This method should be called when you're done with the graph
-        to ensure proper cleanup of native resources.
+        to ensure proper cleanup of native resources. Vertices and edges hold
+        a strong reference to their graph, so an unclosed graph is only
+        released by the cyclic garbage collector.
         """
         if not self._closed:
             # Clean up all vertices and edges
             for vertex in self._vertices.values():
                 vertex._cleanup()
+                vertex._graph_obj = None
             for edge in self._edges.values():
                 edge._cleanup()
+                edge._graph_obj = None
 
             self._vertices.clear()
             self._edges.clear()
+            self._id_to_vertex.clear()
+            # Rebind rather than clear so outstanding elements keep their values
+            self._vertex_columns = {}
+            self._edge_columns = {}
+            self._prop_index = None
+            self._query_cache.clear()
+            self._adjacency_built = False
             self._closed = True
 
     def _check_not_closed(self):
@@ -110,14 +146,18 @@ class TinkerGraph:
         if vertex_id is not None and not isinstance(vertex_id, str):
             raise_validation_error("vertex_id", "str or None", vertex_id)
 
-        # Set default label
+        # Set default label; labels come from a small vocabulary, so intern them
         if label is None:
             label = "vertex"
+        else:
+            label = sys.intern(label)
 
-        # Add label to properties if provided
-        all_properties = dict(properties)
+        # Add label to properties if provided; **properties is already a fresh
+        # dict, so it is only copied when the label has to be added
         if label != "vertex":  # Only add if not default
-            all_properties["label"] = label
+            all_properties = {**properties, "label": label}
+        else:
+            all_properties = properties
 
         try:
             if all_properties:
@@ -135,7 +175,10 @@ class TinkerGraph:
                     self._vertex_id_counter += 1
 
             vertex = Vertex(self, vertex_ptr, vertex_id, label, properties)
+            self._version += 1
             self._vertices[vertex_ptr] = vertex
+            self._id_to_vertex[vertex_id] = vertex
+            self._index_vertex(vertex)
             return vertex
 
         except TinkerGraphNativeError as e:
@@ -165,6 +208,7 @@ class TinkerGraph:
         # Validate parameters
         if not isinstance(label, str):
             raise_validation_error("label", "str", label)
+        label = sys.intern(label)
 
         if not isinstance(out_vertex, Vertex):
             raise_validation_error("out_vertex", "Vertex", out_vertex)
@@ -183,28 +227,269 @@ class TinkerGraph:
             else:
                 edge_ptr = self._native.add_edge(label, out_vertex._ptr, in_vertex._ptr)
 
-            # Generate edge ID if not provided
-            if edge_id is None:
-                edge_id = f"{out_vertex.id}-{label}->{in_vertex.id}"
-
+            # A missing edge ID is generated by Edge on first access
             edge = Edge(self, edge_ptr, edge_id, label, out_vertex, in_vertex, properties)
+            self._version += 1
             self._edges[edge_ptr] = edge
+            if self._adjacency_built:
+                self._link_edge(edge)
             return edge
 
         except TinkerGraphNativeError as e:
             raise TinkerGraphEdgeError(f"Failed to add edge: {e}") from e
 
+    def add_vertices_bulk(self, labels: List[Optional[str]],
+                          ids: Optional[List[Optional[str]]] = None,
+                          properties: Optional[List[Dict[str, Any]]] = None) -> List['Vertex']:
+        """
+        Add many vertices to the graph with a single native call.
+
+        Each row follows the same rules as add_vertex(); the batch is validated
+        once up front and then handed to the native library in one crossing.
+
+        Args:
+            labels: Vertex label per row (None for the default label)
+            ids: Explicit vertex ID per row (optional, None entries auto-generate)
+            properties: Property dictionary per row (optional)
+
+        Returns:
+            The created Vertex instances, in row order
+
+        Raises:
+            TinkerGraphError: If vertex creation fails
+            TinkerGraphValidationError: If parameters are invalid
+        """
+        self._check_not_closed()
+
+        count = len(labels)
+        if ids is None:
+            ids = [None] * count
+        if properties is None:
+            properties = [{}] * count
+        if len(ids) != count or len(properties) != count:
+            raise TinkerGraphValidationError(
+                "labels, ids and properties must have the same length"
+            )
+
+        # Validate parameters
+        for label in labels:
+            if label is not None and not isinstance(label, str):
+                raise_validation_error("labels", "list of str or None", label)
+        for vertex_id in ids:
+            if vertex_id is not None and not isinstance(vertex_id, str):
+                raise_validation_error("ids", "list of str or None", vertex_id)
+        self._validate_property_rows(properties)
+
+        labels = ["vertex" if label is None else sys.intern(label) for label in labels]
+        native_properties = [
+            dict(props, label=label) if label != "vertex" else props
+            for label, props in zip(labels, properties)
+        ]
+
+        try:
+            vertex_ptrs = self._native.add_vertices_bulk(ids, native_properties)
+        except TinkerGraphNativeError as e:
+            raise TinkerGraphVertexError(f"Failed to add vertices: {e}") from e
+
+        # Read every generated ID back in one native call
+        generated = [i for i, vertex_id in enumerate(ids) if vertex_id is None]
+        if generated:
+            try:
+                generated_ids = self._native.get_vertex_ids([vertex_ptrs[i] for i in generated])
+            except TinkerGraphNativeError as e:
+                # Nothing has been registered yet, so release the whole batch
+                for vertex_ptr in vertex_ptrs:
+                    self._native.destroy_vertex(vertex_ptr)
+                raise TinkerGraphVertexError(f"Failed to add vertices: {e}") from e
+            ids = list(ids)
+            for i, vertex_id in zip(generated, generated_ids):
+                ids[i] = vertex_id
+
+        # The batch size is known, so fill a presized list rather than growing one
+        self._version += 1
+        vertices = [None] * count
+        for i, (vertex_ptr, vertex_id, label, props) in enumerate(
+                zip(vertex_ptrs, ids, labels, properties)):
+            vertex = Vertex(self, vertex_ptr, vertex_id, label, props)
+            self._vertices[vertex_ptr] = vertex
+            self._id_to_vertex[vertex_id] = vertex
+            self._index_vertex(vertex)
+            vertices[i] = vertex
+        return vertices
+
+    def add_edges_bulk(self, labels: List[str], out_vertices: List['Vertex'],
+                       in_vertices: List['Vertex'],
+                       properties: Optional[List[Dict[str, Any]]] = None) -> List['Edge']:
+        """
+        Add many edges to the graph with a single native call.
+
+        Args:
+            labels: Edge label per row
+            out_vertices: Source vertex per row
+            in_vertices: Target vertex per row
+            properties: Property dictionary per row (optional)
+
+        Returns:
+            The created Edge instances, in row order
+
+        Raises:
+            TinkerGraphError: If edge creation fails
+            TinkerGraphValidationError: If parameters are invalid
+        """
+        self._check_not_closed()
+
+        count = len(labels)
+        if properties is None:
+            properties = [{}] * count
+        if len(out_vertices) != count or len(in_vertices) != count or len(properties) != count:
+            raise TinkerGraphValidationError(
+                "labels, out_vertices, in_vertices and properties must have the same length"
+            )
+
+        # Validate parameters
+        for label in labels:
+            if not isinstance(label, str):
+                raise_validation_error("labels", "list of str", label)
+        for vertex in out_vertices:
+            if not isinstance(vertex, Vertex):
+                raise_validation_error("out_vertices", "list of Vertex", vertex)
+            if vertex._graph() != self:
+                raise TinkerGraphValidationError("Vertices must belong to the same graph")
+        for vertex in in_vertices:
+            if not isinstance(vertex, Vertex):
+                raise_validation_error("in_vertices", "list of Vertex", vertex)
+            if vertex._graph() != self:
+                raise TinkerGraphValidationError("Vertices must belong to the same graph")
+        self._validate_property_rows(properties)
+
+        labels = [sys.intern(label) for label in labels]
+
+        try:
+            edge_ptrs = self._native.add_edges_bulk(
+                labels,
+                [v._ptr for v in out_vertices],
+                [v._ptr for v in in_vertices],
+                properties,
+            )
+        except TinkerGraphNativeError as e:
+            raise TinkerGraphEdgeError(f"Failed to add edges: {e}") from e
+
+        self._version += 1
+        edges = [None] * count
+        for i, (edge_ptr, label, out_vertex, in_vertex, props) in enumerate(
+                zip(edge_ptrs, labels, out_vertices, in_vertices, properties)):
+            edge = Edge(self, edge_ptr, None, label, out_vertex, in_vertex, props)
+            self._edges[edge_ptr] = edge
+            if self._adjacency_built:
+                self._link_edge(edge)
+            edges[i] = edge
+        return edges
+
+    @staticmethod
+    def _validate_property_rows(properties: List[Dict[str, Any]]):
+        """Check that every row of a bulk call's properties is a dict with str keys."""
+        for row in properties:
+            if not isinstance(row, dict):
+                raise_validation_error("properties", "list of dict", row)
+            for key in row:
+                if not isinstance(key, str):
+                    raise_validation_error("properties", "dict with str keys", key)
+
+    def _ensure_adjacency(self):
+        """Build every vertex's adjacency arrays if no traversal has needed them yet."""
+        if not self._adjacency_built:
+            self._adjacency_built = True
+            for edge in self._edges.values():
+                self._link_edge(edge)
+
+    def _link_edge(self, edge: 'Edge'):
+        """Append an edge to the adjacency arrays of both of its endpoints."""
+        out_vertex, in_vertex = edge.out_vertex, edge.in_vertex
+        out_vertex._out_edge_ptrs.append(edge._ptr)
+        out_vertex._out_neighbors.append(in_vertex._ptr)
+        out_vertex._out_by_label.setdefault(edge.label, array('Q')).append(edge._ptr)
+        in_vertex._in_edge_ptrs.append(edge._ptr)
+        in_vertex._in_neighbors.append(out_vertex._ptr)
+        in_vertex._in_by_label.setdefault(edge.label, array('Q')).append(edge._ptr)
+
+    def _unlink_edge(self, edge: 'Edge'):
+        """Drop an edge from the adjacency arrays of both of its endpoints."""
+        out_vertex, in_vertex = edge.out_vertex, edge.in_vertex
+        i = out_vertex._out_edge_ptrs.index(edge._ptr)
+        del out_vertex._out_edge_ptrs[i]
+        del out_vertex._out_neighbors[i]
+        self._unlink_label(out_vertex._out_by_label, edge)
+        i = in_vertex._in_edge_ptrs.index(edge._ptr)
+        del in_vertex._in_edge_ptrs[i]
+        del in_vertex._in_neighbors[i]
+        self._unlink_label(in_vertex._in_by_label, edge)
+
+    def _unlink_vertex_edges(self, vertex: 'Vertex', edge_ptrs: Dict[int, None]):
+        """
+        Drop all of a vertex's edges from the adjacency arrays at once.
+
+        Unlinking edge by edge searches the arrays once per edge, which is
+        quadratic in the degree of the vertex being removed. Instead its own
+        arrays are emptied, and each neighbor's arrays are filtered in a single
+        pass.
+        """
+        vertices = self._vertices
+        # Neighbors reached by an out-edge hold it in their in-arrays, and vice versa
+        targets = {ptr: vertices[ptr] for ptr in vertex._out_neighbors if ptr != vertex._ptr}
+        sources = {ptr: vertices[ptr] for ptr in vertex._in_neighbors if ptr != vertex._ptr}
+        for neighbor in targets.values():
+            neighbor._in_edge_ptrs, neighbor._in_neighbors = self._without_edges(
+                neighbor._in_edge_ptrs, neighbor._in_neighbors, edge_ptrs)
+            self._filter_labels(neighbor._in_by_label, edge_ptrs)
+        for neighbor in sources.values():
+            neighbor._out_edge_ptrs, neighbor._out_neighbors = self._without_edges(
+                neighbor._out_edge_ptrs, neighbor._out_neighbors, edge_ptrs)
+            self._filter_labels(neighbor._out_by_label, edge_ptrs)
+
+        for ptrs in (vertex._out_edge_ptrs, vertex._out_neighbors,
+                     vertex._in_edge_ptrs, vertex._in_neighbors):
+            del ptrs[:]
+        vertex._out_by_label.clear()
+        vertex._in_by_label.clear()
+
+    @staticmethod
+    def _without_edges(edge_ptrs: array, neighbors: array,
+                       dropped: Dict[int, None]) -> Tuple[array, array]:
+        """Copy a pair of parallel adjacency arrays, leaving out the dropped edges."""
+        keep = [i for i, ptr in enumerate(edge_ptrs) if ptr not in dropped]
+        return (array('Q', [edge_ptrs[i] for i in keep]),
+                array('Q', [neighbors[i] for i in keep]))
+
+    @staticmethod
+    def _filter_labels(by_label: Dict[str, array], dropped: Dict[int, None]):
+        """Leave the dropped edges out of one side of a vertex's per-label adjacency."""
+        for label in list(by_label):
+            kept = array('Q', [ptr for ptr in by_label[label] if ptr not in dropped])
+            if kept:
+                by_label[label] = kept
+            else:
+                del by_label[label]
+
+    @staticmethod
+    def _unlink_label(by_label: Dict[str, array], edge: 'Edge'):
+        """Drop an edge from one side of a vertex's per-label adjacency."""
+        ptrs = by_label[edge.label]
+        del ptrs[ptrs.index(edge._ptr)]
+        if not ptrs:
+            del by_label[edge.label]
+
     @property
     def vertex_count(self) -> int:
         """Get the number of vertices in the graph."""
         self._check_not_closed()
-        return self._native.vertex_count()
+        # Every live vertex is registered in _vertices, so no native call is needed
+        return len(self._vertices)
 
     @property
     def edge_count(self) -> int:
         """Get the number of edges in the graph."""
         self._check_not_closed()
-        return self._native.edge_count()
+        return len(self._edges)
 
     def vertices(self, **properties) -> List['Vertex']:
         """
@@ -217,12 +502,100 @@ class TinkerGraph:
             List of vertices matching the criteria
         """
         self._check_not_closed()
-        vertices = list(self._vertices.values())
+        if not properties:
+            return list(self._vertices.values())
+        return self._cached_query("V", properties, self._filter_vertices)
+
+    def _filter_vertices(self, properties: Dict[str, Any]) -> List['Vertex']:
+        """Answer a filtered vertices() query from the property index."""
+        if self._prop_index is None:
+            self._build_prop_index()
+
+        candidates = None
+        unindexed = {}
+        for key, value in properties.items():
+            try:
+                ptrs = self._prop_index.get((key, value), set())
+            except TypeError:
+                # Unhashable filter values can't be looked up; check them by scan
+                unindexed[key] = value
+                continue
+            candidates = ptrs if candidates is None else candidates & ptrs
+            if not candidates:
+                return []
+
+        if unindexed:
+            return self._scan_columns(self._vertices, self._vertex_columns, unindexed, candidates)
+        # Sets iterate in pointer-hash order; put the hits back in insertion order
+        vertices = [self._vertices[ptr] for ptr in candidates]
+        vertices.sort(key=attrgetter('_seq'))
+        return vertices
 
-        if properties:
-            vertices = [v for v in vertices if v._matches_properties(properties)]
+    @staticmethod
+    def _scan_columns(elements: Dict[int, Any], columns: Dict[str, Dict[int, Any]],
+                      filters: Dict[str, Any], ptrs=None) -> list:
+        """Filter elements by scanning one property column per filter key.
 
-        return vertices
+        Matches are returned in the elements' insertion order, which a column's
+        own order does not follow once properties are set after creation.
+        """
+        for key, value in filters.items():
+            column = columns.get(key)
+            if column is None:
+                return []
+            if ptrs is None:
+                ptrs = [ptr for ptr, v in column.items() if v == value]
+            else:
+                ptrs = [ptr for ptr in ptrs if column.get(ptr, _MISSING) == value]
+        if not ptrs:
+            return []
+        matched = set(ptrs)
+        return [element for ptr, element in elements.items() if ptr in matched]
+
+    def _build_prop_index(self):
+        """Build the (key, value) -> vertex secondary index from scratch."""
+        self._prop_index = {}
+        for key, column in self._vertex_columns.items():
+            for ptr, value in column.items():
+                try:
+                    self._prop_index.setdefault((key, value), set()).add(ptr)
+                except TypeError:
+                    pass
+
+    def _index_vertex(self, vertex: 'Vertex'):
+        """Add all of a vertex's properties to the secondary index."""
+        if self._prop_index is not None:
+            for key, value in vertex.properties.items():
+                self._index_property(vertex, key, value)
+
+    def _unindex_vertex(self, vertex: 'Vertex'):
+        """Remove all of a vertex's properties from the secondary index."""
+        if self._prop_index is not None:
+            for key, value in vertex.properties.items():
+                self._unindex_property(vertex, key, value)
+
+    def _index_property(self, vertex: 'Vertex', key: str, value: Any):
+        """Record a single vertex property in the secondary index."""
+        if self._prop_index is None or vertex._ptr not in self._vertices:
+            return
+        try:
+            self._prop_index.setdefault((key, value), set()).add(vertex._ptr)
+        except TypeError:
+            # Unhashable values are not indexed; queries on them fall back to a scan
+            pass
+
+    def _unindex_property(self, vertex: 'Vertex', key: str, value: Any):
+        """Drop a single vertex property from the secondary index."""
+        if self._prop_index is None:
+            return
+        try:
+            ptrs = self._prop_index.get((key, value))
+        except TypeError:
+            return
+        if ptrs is not None:
+            ptrs.discard(vertex._ptr)
+            if not ptrs:
+                del self._prop_index[(key, value)]
 
     def edges(self, **properties) -> List['Edge']:
         """
@@ -235,28 +608,57 @@ class TinkerGraph:
             List of edges matching the criteria
         """
         self._check_not_closed()
-        edges = list(self._edges.values())
+        if not properties:
+            return list(self._edges.values())
+        return self._cached_query("E", properties, self._filter_edges)
 
-        if properties:
-            edges = [e for e in edges if e._matches_properties(properties)]
+    def _filter_edges(self, properties: Dict[str, Any]) -> List['Edge']:
+        """Answer a filtered edges() query by scanning property columns."""
+        return self._scan_columns(self._edges, self._edge_columns, properties)
 
-        return edges
+    def _cached_query(self, kind: str, filters: Dict[str, Any], compute) -> list:
+        """
+        Return compute(filters), reusing the result until the next mutation.
 
-    def get_vertex(self, vertex_id: str) -> Optional['Vertex']:
+        Results are kept in a small LRU keyed by element kind and filter
+        items; callers get a copy so they cannot alter the cached list.
+        """
+        cache = self._query_cache
+        if self._query_cache_version != self._version:
+            cache.clear()
+            self._query_cache_version = self._version
+        try:
+            key = (kind, frozenset(filters.items()))
+            result = cache.get(key)
+        except TypeError:
+            # Unhashable filter value; evaluate without caching
+            return compute(filters)
+        if result is None:
+            result = cache[key] = compute(filters)
+            if len(cache) > _QUERY_CACHE_SIZE:
+                cache.popitem(last=False)
+        else:
+            cache.move_to_end(key)
+        return list(result)
+
+    def get_vertex(self, vertex_id: Union[str, int]) -> Optional['Vertex']:
         """
         Get a vertex by ID.
 
         Args:
-            vertex_id: The vertex ID to search for
+            vertex_id: The vertex ID to search for; auto-generated IDs may
+                also be given as the integer the native graph assigned
 
         Returns:
-            The vertex if found, None otherwise
+            The vertex if found, None otherwise (including for IDs of any
+            other type)
         """
         self._check_not_closed()
-        for vertex in self._vertices.values():
-            if vertex.id == vertex_id:
-                return vertex
-        return None
+        if isinstance(vertex_id, int):
+            vertex_id = str(vertex_id)
+        elif not isinstance(vertex_id, str):
+            return None
+        return self._id_to_vertex.get(vertex_id)
 
     def remove_vertex(self, vertex: 'Vertex'):
         """
@@ -269,14 +671,24 @@ class TinkerGraph:
         """
         self._check_not_closed()
         if vertex._ptr in self._vertices:
-            # Remove connected edges first
-            edges_to_remove = [e for e in self._edges.values()
-                             if e.out_vertex == vertex or e.in_vertex == vertex]
-            for edge in edges_to_remove:
-                self.remove_edge(edge)
+            # Remove connected edges first, straight from the adjacency pointer
+            # arrays; self-loops appear on both sides, so dedupe by pointer
+            self._ensure_adjacency()
+            edges = self._edges
+            edge_ptrs = dict.fromkeys(vertex._out_edge_ptrs + vertex._in_edge_ptrs)
+            self._unlink_vertex_edges(vertex, edge_ptrs)
+            for ptr in edge_ptrs:
+                self._drop_edge(edges[ptr])
 
             # Remove the vertex
+            self._version += 1
+            self._unindex_vertex(vertex)
+            if self._id_to_vertex.get(vertex.id) is vertex:
+                del self._id_to_vertex[vertex.id]
+            vertex._detach_properties()
             vertex._cleanup()
+            # Break the element -> graph reference, as close() does
+            vertex._graph_obj = None
             del self._vertices[vertex._ptr]
 
     def remove_edge(self, edge: 'Edge'):
@@ -288,8 +700,17 @@ class TinkerGraph:
         """
         self._check_not_closed()
         if edge._ptr in self._edges:
-            edge._cleanup()
-            del self._edges[edge._ptr]
+            if self._adjacency_built:
+                self._unlink_edge(edge)
+            self._drop_edge(edge)
+
+    def _drop_edge(self, edge: 'Edge'):
+        """Release an edge that is no longer in any adjacency array."""
+        self._version += 1
+        edge._detach_properties()
+        edge._cleanup()
+        edge._graph_obj = None
+        del self._edges[edge._ptr]
 
     def clear(self):
         """Remove all vertices and edges from the graph."""
@@ -314,9 +735,106 @@ class TinkerGraph:
         return f"<TinkerGraph at 0x{id(self):x}: {self.vertex_count}V, {self.edge_count}E>"
 
 
+class _PropertyMap(MutableMapping):
+    """
+    Live dict-like view of one element's properties.
+
+    Property values are stored column-wise on the graph; this view reads and
+    writes the owning element's entries so ``element.properties[key]`` keeps
+    working. Writes go through the element's set/remove_property methods.
+    """
+
+    __slots__ = ('_element',)
+
+    def __init__(self, element):
+        self._element = element
+
+    def __getitem__(self, key):
+        column = self._element._columns.get(key)
+        if column is None or self._element._ptr not in column:
+            raise KeyError(key)
+        return column[self._element._ptr]
+
+    def __setitem__(self, key, value):
+        self._element.set_property(key, value)
+
+    def __delitem__(self, key):
+        if key not in self:
+            raise KeyError(key)
+        self._element.remove_property(key)
+
+    def __contains__(self, key) -> bool:
+        column = self._element._columns.get(key)
+        return column is not None and self._element._ptr in column
+
+    def __iter__(self):
+        ptr = self._element._ptr
+        return iter([key for key, column in self._element._columns.items() if ptr in column])
+
+    def __len__(self) -> int:
+        ptr = self._element._ptr
+        return sum(1 for column in self._element._columns.values() if ptr in column)
+
+    def __repr__(self) -> str:
+        return repr(dict(self.items()))
+
+
+class _ElementView(Sequence):
+    """
+    Read-only, list-like result of a traversal.
+
+    Indexing, iteration and len() follow the underlying list; membership tests
+    go through a set built on first use, so repeated ``x in view`` checks are
+    O(1) instead of a scan.
+    """
+
+    __slots__ = ('_items', '_members')
+
+    def __init__(self, items: list):
+        self._items = items
+        self._members = None
+
+    def __getitem__(self, index):
+        return self._items[index]
+
+    def __len__(self) -> int:
+        return len(self._items)
+
+    def __iter__(self):
+        return iter(self._items)
+
+    def __contains__(self, item) -> bool:
+        if self._members is None:
+            self._members = set(self._items)
+        try:
+            return item in self._members
+        except TypeError:
+            return False
+
+    def __eq__(self, other) -> bool:
+        if isinstance(other, _ElementView):
+            other = other._items
+        return self._items == other
+
+    __hash__ = None
+
+    def __add__(self, other) -> list:
+        return self._items + list(other)
+
+    def __radd__(self, other) -> list:
+        return list(other) + self._items
+
+    def __repr__(self) -> str:
+        return repr(self._items)
+
+
 class Vertex:
     """Represents a vertex in the TinkerGraph."""
 
+    __slots__ = ('_graph_obj', '_ptr', 'id', '_hash', 'label', '_columns', '_disposed',
+                 '_out_edge_ptrs', '_out_neighbors', '_in_edge_ptrs', '_in_neighbors',
+                 '_out_by_label', '_in_by_label', '_seq', '__weakref__')
+
     def __init__(self, graph: TinkerGraph, ptr: int, vertex_id: str,
                  label: str, properties: Dict[str, Any]):
         """
@@ -329,16 +847,29 @@ class Vertex:
             label: The vertex label
             properties: Initial properties
         """
-        self._graph_ref = weakref.ref(graph)
+        # Plain reference; TinkerGraph.close() clears it
+        self._graph_obj = graph
         self._ptr = ptr
         self.id = vertex_id
+        self._hash = hash(vertex_id)
+        self._seq = next(graph._vertex_seq)
         self.label = label
-        self.properties = dict(properties)
+        self._columns = graph._vertex_columns
+        for key, value in properties.items():
+            self._columns.setdefault(sys.intern(key), {})[ptr] = value
         self._disposed = False
+        # Adjacency as parallel arrays of native pointers: edge i leads to neighbor i
+        self._out_edge_ptrs = array('Q')
+        self._out_neighbors = array('Q')
+        self._in_edge_ptrs = array('Q')
+        self._in_neighbors = array('Q')
+        # The same edge pointers grouped by label, for label-filtered traversals
+        self._out_by_label: Dict[str, array] = {}
+        self._in_by_label: Dict[str, array] = {}
 
     def _graph(self) -> Optional[TinkerGraph]:
-        """Get the parent graph (may be None if graph was garbage collected)."""
-        return self._graph_ref()
+        """Get the parent graph (None once the element is removed or the graph is closed)."""
+        return self._graph_obj
 
     def _cleanup(self):
         """Clean up native resources."""
@@ -351,64 +882,134 @@ class Vertex:
                     pass
             self._disposed = True
 
+    def _detach_properties(self):
+        """Move this vertex's values out of the graph columns into private ones."""
+        detached = {}
+        for key in list(self._columns):
+            column = self._columns[key]
+            if self._ptr in column:
+                detached[key] = {self._ptr: column.pop(self._ptr)}
+                if not column:
+                    del self._columns[key]
+        self._columns = detached
+
+    @property
+    def properties(self) -> _PropertyMap:
+        """The vertex's properties as a mutable mapping."""
+        return _PropertyMap(self)
+
     def _matches_properties(self, filters: Dict[str, Any]) -> bool:
         """Check if vertex matches property filters."""
         for key, value in filters.items():
-            if key not in self.properties or self.properties[key] != value:
+            column = self._columns.get(key)
+            if column is None or column.get(self._ptr, _MISSING) != value:
                 return False
         return True
 
     def get_property(self, key: str, default=None):
         """Get a property value by key."""
-        return self.properties.get(key, default)
+        column = self._columns.get(key)
+        if column is None:
+            return default
+        return column.get(self._ptr, default)
 
     def set_property(self, key: str, value: Any):
         """Set a property value (local only - not synchronized with native)."""
         if not isinstance(key, str):
             raise_validation_error("key", "str", key)
-        self.properties[key] = value
+        column = self._columns.setdefault(sys.intern(key), {})
+        graph = self._graph()
+        if graph is not None:
+            old_value = column.get(self._ptr, _MISSING)
+            if old_value is not _MISSING:
+                graph._unindex_property(self, key, old_value)
+        column[self._ptr] = value
+        if graph is not None:
+            graph._version += 1
+            graph._index_property(self, key, value)
 
     def remove_property(self, key: str) -> Any:
         """Remove a property and return its value."""
-        return self.properties.pop(key, None)
+        column = self._columns.get(key)
+        if column is None or self._ptr not in column:
+            return None
+        value = column.pop(self._ptr)
+        if not column:
+            del self._columns[key]
+        graph = self._graph()
+        if graph is not None:
+            graph._version += 1
+            graph._unindex_property(self, key, value)
+        return value
 
-    def out_edges(self, *labels) -> List['Edge']:
-        """Get outgoing edges, optionally filtered by label."""
+    def out_edges(self, *labels) -> '_ElementView':
+        """Get outgoing edges, optionally filtered by label (grouped by label, in argument order)."""
         graph = self._graph()
         if not graph:
-            return []
+            return _ElementView([])
+        graph._ensure_adjacency()
 
-        edges = [e for e in graph._edges.values() if e.out_vertex == self]
+        edges = graph._edges
         if labels:
-            edges = [e for e in edges if e.label in labels]
-        return edges
+            return _ElementView(self._edges_by_label(edges, self._out_by_label, labels))
+        return _ElementView([edges[ptr] for ptr in self._out_edge_ptrs])
 
-    def in_edges(self, *labels) -> List['Edge']:
-        """Get incoming edges, optionally filtered by label."""
+    def in_edges(self, *labels) -> '_ElementView':
+        """Get incoming edges, optionally filtered by label (grouped by label, in argument order)."""
         graph = self._graph()
         if not graph:
-            return []
+            return _ElementView([])
+        graph._ensure_adjacency()
 
-        edges = [e for e in graph._edges.values() if e.in_vertex == self]
+        edges = graph._edges
         if labels:
-            edges = [e for e in edges if e.label in labels]
-        return edges
-
-    def both_edges(self, *labels) -> List['Edge']:
+            return _ElementView(self._edges_by_label(edges, self._in_by_label, labels))
+        return _ElementView([edges[ptr] for ptr in self._in_edge_ptrs])
+
+    @staticmethod
+    def _edges_by_label(edges: Dict[int, 'Edge'], by_label: Dict[str, array],
+                        labels: tuple) -> list:
+        """Collect the edges stored under each requested label, visiting each label once."""
+        if len(labels) == 1:
+            return [edges[ptr] for ptr in by_label.get(labels[0], ())]
+        return [edges[ptr] for label in dict.fromkeys(labels)
+                for ptr in by_label.get(label, ())]
+
+    def both_edges(self, *labels) -> '_ElementView':
         """Get all connected edges, optionally filtered by label."""
-        return self.out_edges(*labels) + self.in_edges(*labels)
+        # out_edges() builds a fresh list, so the in-side can be appended to it
+        edges = self.out_edges(*labels)._items
+        edges.extend(self.in_edges(*labels))
+        return _ElementView(edges)
 
-    def out_vertices(self, *labels) -> List['Vertex']:
+    def out_vertices(self, *labels) -> '_ElementView':
         """Get vertices connected by outgoing edges."""
-        return [e.in_vertex for e in self.out_edges(*labels)]
+        if labels:
+            return _ElementView([e.in_vertex for e in self.out_edges(*labels)])
+        graph = self._graph()
+        if not graph:
+            return _ElementView([])
+        graph._ensure_adjacency()
+        vertices = graph._vertices
+        return _ElementView([vertices[ptr] for ptr in self._out_neighbors])
 
-    def in_vertices(self, *labels) -> List['Vertex']:
+    def in_vertices(self, *labels) -> '_ElementView':
         """Get vertices connected by incoming edges."""
-        return [e.out_vertex for e in self.in_edges(*labels)]
+        if labels:
+            return _ElementView([e.out_vertex for e in self.in_edges(*labels)])
+        graph = self._graph()
+        if not graph:
+            return _ElementView([])
+        graph._ensure_adjacency()
+        vertices = graph._vertices
+        return _ElementView([vertices[ptr] for ptr in self._in_neighbors])
 
-    def both_vertices(self, *labels) -> List['Vertex']:
+    def both_vertices(self, *labels) -> '_ElementView':
         """Get all connected vertices."""
-        return self.out_vertices(*labels) + self.in_vertices(*labels)
+        # out_vertices() builds a fresh list, so the in-side can be appended to it
+        vertices = self.out_vertices(*labels)._items
+        vertices.extend(self.in_vertices(*labels))
+        return _ElementView(vertices)
 
     def __str__(self) -> str:
         """String representation of the vertex."""
@@ -421,19 +1022,24 @@ class Vertex:
 
     def __eq__(self, other) -> bool:
         """Check equality based on ID and graph."""
+        if other is self:
+            return True
         if not isinstance(other, Vertex):
-            return False
-        return self.id == other.id and self._graph() == other._graph()
+            return NotImplemented
+        return self.id == other.id and self._graph_obj is other._graph_obj
 
     def __hash__(self) -> int:
-        """Hash based on ID."""
-        return hash(self.id)
+        """Hash based on ID (computed once at construction)."""
+        return self._hash
 
 
 class Edge:
     """Represents an edge in the TinkerGraph."""
 
-    def __init__(self, graph: TinkerGraph, ptr: int, edge_id: str, label: str,
+    __slots__ = ('_graph_obj', '_ptr', '_id', '_hash', 'label', 'out_vertex', 'in_vertex',
+                 '_columns', '_disposed', '__weakref__')
+
+    def __init__(self, graph: TinkerGraph, ptr: int, edge_id: Optional[str], label: str,
                  out_vertex: Vertex, in_vertex: Vertex, properties: Dict[str, Any]):
         """
         Initialize an edge.
@@ -441,24 +1047,35 @@ class Edge:
         Args:
             graph: The parent graph
             ptr: Native pointer to the edge
-            edge_id: The edge ID
+            edge_id: The edge ID, or None to derive it from the endpoints on first access
             label: The edge label
             out_vertex: Source vertex
             in_vertex: Target vertex
             properties: Initial properties
         """
-        self._graph_ref = weakref.ref(graph)
+        # Plain reference; TinkerGraph.close() clears it
+        self._graph_obj = graph
         self._ptr = ptr
-        self.id = edge_id
+        self._id = edge_id
+        self._hash = None
         self.label = label
         self.out_vertex = out_vertex
         self.in_vertex = in_vertex
-        self.properties = dict(properties)
+        self._columns = graph._edge_columns
+        for key, value in properties.items():
+            self._columns.setdefault(sys.intern(key), {})[ptr] = value
         self._disposed = False
 
+    @property
+    def id(self) -> str:
+        """The edge ID; generated ones are formatted on first access."""
+        if self._id is None:
+            self._id = f"{self.out_vertex.id}-{self.label}->{self.in_vertex.id}"
+        return self._id
+
     def _graph(self) -> Optional[TinkerGraph]:
-        """Get the parent graph (may be None if graph was garbage collected)."""
-        return self._graph_ref()
+        """Get the parent graph (None once the element is removed or the graph is closed)."""
+        return self._graph_obj
 
     def _cleanup(self):
         """Clean up native resources."""
@@ -471,26 +1088,60 @@ class Edge:
                     pass
             self._disposed = True
 
+    def _detach_properties(self):
+        """Move this edge's values out of the graph columns into private ones."""
+        detached = {}
+        for key in list(self._columns):
+            column = self._columns[key]
+            if self._ptr in column:
+                detached[key] = {self._ptr: column.pop(self._ptr)}
+                if not column:
+                    del self._columns[key]
+        self._columns = detached
+
+    @property
+    def properties(self) -> _PropertyMap:
+        """The edge's properties as a mutable mapping."""
+        return _PropertyMap(self)
+
     def _matches_properties(self, filters: Dict[str, Any]) -> bool:
         """Check if edge matches property filters."""
         for key, value in filters.items():
-            if key not in self.properties or self.properties[key] != value:
+            column = self._columns.get(key)
+            if column is None or column.get(self._ptr, _MISSING) != value:
                 return False
         return True
 
     def get_property(self, key: str, default=None):
         """Get a property value by key."""
-        return self.properties.get(key, default)
+        column = self._columns.get(key)
+        if column is None:
+            return default
+        return column.get(self._ptr, default)
 
     def set_property(self, key: str, value: Any):
         """Set a property value (local only - not synchronized with native)."""
         if not isinstance(key, str):
             raise_validation_error("key", "str", key)
-        self.properties[key] = value
+        self._columns.setdefault(sys.intern(key), {})[self._ptr] = value
+        self._touch_graph()
 
     def remove_property(self, key: str) -> Any:
         """Remove a property and return its value."""
-        return self.properties.pop(key, None)
+        column = self._columns.get(key)
+        if column is None or self._ptr not in column:
+            return None
+        value = column.pop(self._ptr)
+        if not column:
+            del self._columns[key]
+        self._touch_graph()
+        return value
+
+    def _touch_graph(self):
+        """Invalidate the parent graph's cached query results."""
+        graph = self._graph()
+        if graph is not None:
+            graph._version += 1
 
     def other_vertex(self, vertex: Vertex) -> Vertex:
         """Get the other vertex of this edge."""
@@ -514,10 +1165,14 @@ class Edge:
 
     def __eq__(self, other) -> bool:
         """Check equality based on ID and graph."""
+        if other is self:
+            return True
         if not isinstance(other, Edge):
-            return False
-        return self.id == other.id and self._graph() == other._graph()
+            return NotImplemented
+        return self.id == other.id and self._graph_obj is other._graph_obj
 
     def __hash__(self) -> int:
-        """Hash based on ID."""
-        return hash(self.id)
+        """Hash based on ID (computed once, on first use)."""
+        if self._hash is None:
+            self._hash = hash(self.id)
+        return self._hash
@@ -138,6 +138,110 @@ fun addEdgeWithProperties(
     }
 }
 
+/**
+ * Add a batch of vertices in a single call.
+ *
+ * Properties are passed flattened: row `i` owns the next `propertyCounts[i]`
+ * entries of `propertyKeys`/`propertyValues`. The created vertex handles are
+ * written to `outVertices`. Returns the number of vertices created, which is
+ * less than `count` if a row failed, or -1 if the arguments are invalid.
+ */
+@CName("tinkergraph_add_vertices_bulk")
+fun addVerticesBulk(
+    graphPtr: COpaquePointer?,
+    ids: CPointer<CPointerVar<ByteVar>>?,
+    propertyKeys: CPointer<CPointerVar<ByteVar>>?,
+    propertyValues: CPointer<CPointerVar<ByteVar>>?,
+    propertyCounts: CPointer<IntVar>?,
+    count: Int,
+    outVertices: CPointer<COpaquePointerVar>?
+): Int {
+    var created = 0
+    return try {
+        val graph = graphPtr?.asStableRef<TinkerGraph>()?.get() ?: return -1
+        if (outVertices == null) return -1
+
+        var offset = 0
+        for (row in 0 until count) {
+            val properties = mutableListOf<Any?>()
+            val idStr = ids?.get(row)?.toKString()
+            if (idStr != null) {
+                properties.add("id")
+                properties.add(idStr)
+            }
+
+            val propertyCount = propertyCounts?.get(row) ?: 0
+            if (propertyKeys != null && propertyValues != null) {
+                for (i in offset until offset + propertyCount) {
+                    val key = propertyKeys[i]?.toKString() ?: continue
+                    val value = propertyValues[i]?.toKString() ?: continue
+                    properties.add(key)
+                    properties.add(value)
+                }
+            }
+            offset += propertyCount
+
+            val vertex = graph.addVertex(*properties.toTypedArray())
+            outVertices[row] = StableRef.create(vertex).asCPointer()
+            created++
+        }
+        created
+    } catch (e: Exception) {
+        created
+    }
+}
+
+/**
+ * Add a batch of edges in a single call.
+ *
+ * Uses the same flattened property layout as [addVerticesBulk]. The created
+ * edge handles are written to `outEdges`. Returns the number of edges created,
+ * or -1 if the arguments are invalid.
+ */
+@CName("tinkergraph_add_edges_bulk")
+fun addEdgesBulk(
+    graphPtr: COpaquePointer?,
+    labels: CPointer<CPointerVar<ByteVar>>?,
+    outVertexPtrs: CPointer<COpaquePointerVar>?,
+    inVertexPtrs: CPointer<COpaquePointerVar>?,
+    propertyKeys: CPointer<CPointerVar<ByteVar>>?,
+    propertyValues: CPointer<CPointerVar<ByteVar>>?,
+    propertyCounts: CPointer<IntVar>?,
+    count: Int,
+    outEdges: CPointer<COpaquePointerVar>?
+): Int {
+    var created = 0
+    return try {
+        val graph = graphPtr?.asStableRef<TinkerGraph>()?.get() ?: return -1
+        if (labels == null || outVertexPtrs == null || inVertexPtrs == null || outEdges == null) return -1
+
+        var offset = 0
+        for (row in 0 until count) {
+            val labelStr = labels[row]?.toKString() ?: return created
+            val outVertex = outVertexPtrs[row]?.asStableRef<Vertex>()?.get() as? TinkerVertex ?: return created
+            val inVertex = inVertexPtrs[row]?.asStableRef<Vertex>()?.get() as? TinkerVertex ?: return created
+
+            val properties = mutableMapOf<String, Any?>()
+            val propertyCount = propertyCounts?.get(row) ?: 0
+            if (propertyKeys != null && propertyValues != null) {
+                for (i in offset until offset + propertyCount) {
+                    val key = propertyKeys[i]?.toKString() ?: continue
+                    val value = propertyValues[i]?.toKString() ?: continue
+                    properties[key] = value
+                }
+            }
+            offset += propertyCount
+
+            val edge = graph.addEdge(outVertex, inVertex, labelStr, properties)
+            outEdges[row] = StableRef.create(edge).asCPointer()
+            created++
+        }
+        created
+    } catch (e: Exception) {
+        created
+    }
+}
+
 @CName("tinkergraph_vertex_count")
 fun getVertexCount(graphPtr: COpaquePointer?): Long {
     return try {
@@ -196,6 +300,58 @@ fun getEdgeLabel(edgePtr: COpaquePointer?, buffer: CPointer<ByteVar>?, bufferSiz
     }
 }
 
+/**
+ * Copy the IDs of a batch of vertices into one packed UTF-8 buffer.
+ * offsets receives count + 1 entries; row i occupies bytes offsets[i] until offsets[i + 1].
+ * The bytes are only written when the whole batch fits in bufferSize.
+ * Returns the total byte length of the batch, or -1 on failure.
+ */
+@CName("tinkergraph_vertex_ids_bulk")
+fun getVertexIdsBulk(
+    vertices: CPointer<COpaquePointerVar>?,
+    count: Int,
+    buffer: CPointer<ByteVar>?,
+    bufferSize: Int,
+    offsets: CPointer<IntVar>?
+): Int {
+    return try {
+        if (vertices == null) return -1
+        val encoded = arrayOfNulls<ByteArray>(count)
+        for (row in 0 until count) {
+            val vertex = vertices[row]?.asStableRef<Vertex>()?.get() ?: return -1
+            encoded[row] = (vertex.id()?.toString() ?: "").encodeToByteArray()
+        }
+        packStrings(encoded, buffer, bufferSize, offsets)
+    } catch (e: Exception) {
+        -1
+    }
+}
+
+/**
+ * Copy the labels of a batch of edges into one packed UTF-8 buffer.
+ * Uses the same buffer and offsets layout as tinkergraph_vertex_ids_bulk.
+ */
+@CName("tinkergraph_edge_labels_bulk")
+fun getEdgeLabelsBulk(
+    edges: CPointer<COpaquePointerVar>?,
+    count: Int,
+    buffer: CPointer<ByteVar>?,
+    bufferSize: Int,
+    offsets: CPointer<IntVar>?
+): Int {
+    return try {
+        if (edges == null) return -1
+        val encoded = arrayOfNulls<ByteArray>(count)
+        for (row in 0 until count) {
+            val edge = edges[row]?.asStableRef<Edge>()?.get() ?: return -1
+            encoded[row] = edge.label().encodeToByteArray()
+        }
+        packStrings(encoded, buffer, bufferSize, offsets)
+    } catch (e: Exception) {
+        -1
+    }
+}
+
 @CName("tinkergraph_destroy_vertex")
 fun destroyVertex(vertexPtr: COpaquePointer?) {
     try {
@@ -230,6 +386,30 @@ fun getLastErrorMessage(buffer: CPointer<ByteVar>?, bufferSize: Int): Int {
     return bytes.size
 }
 
+private fun packStrings(
+    encoded: Array<ByteArray?>,
+    buffer: CPointer<ByteVar>?,
+    bufferSize: Int,
+    offsets: CPointer<IntVar>?
+): Int {
+    var total = 0
+    offsets?.set(0, 0)
+    for (row in encoded.indices) {
+        total += encoded[row]!!.size
+        offsets?.set(row + 1, total)
+    }
+
+    if (buffer != null && total <= bufferSize) {
+        var position = 0
+        for (bytes in encoded) {
+            bytes!!.copyInto(buffer, position, 0, bytes.size)
+            position += bytes.size
+        }
+    }
+
+    return total
+}
+
 private fun ByteArray.copyInto(
     destination: CPointer<ByteVar>,
     destinationOffset: Int,